@@ -3,18 +3,63 @@ Combined Claude Adopter Scanner MCP
 Single MCP with all tools for finding companies using Claude Desktop/Code.
 """
 
+import asyncio
 import os
+import re
+import time
+from bisect import bisect_right
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from urllib.parse import urlencode
 
 import httpx
+import orjson
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
 load_dotenv()
 
+
+# Shared HTTP client, reused by every tool so connections (and HTTP/2 streams)
+# are kept alive across calls instead of re-handshaking per invocation.
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _http_client
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Close the shared HTTP client when the server shuts down."""
+    global _http_client
+
+    try:
+        yield
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+
+
 mcp = FastMCP(
     "Claude Adopter Finder",
     instructions="Find companies using Claude Desktop/Code via job postings, GitHub, and web signals",
+    lifespan=_lifespan,
 )
 
 # API Keys
@@ -32,11 +77,43 @@ PYPI_API = "https://pypi.org/pypi"
 BRAVE_SEARCH_API = "https://api.search.brave.com/res/v1"
 LINKEDIN_API = "https://www.linkedin.com/voyager/api"
 
+# Request headers (built once and shared read-only; tools only run when the
+# matching key is set)
+GITHUB_HEADERS = MappingProxyType({
+    "Accept": "application/vnd.github.v3+json",
+    "Authorization": f"token {GITHUB_TOKEN}",
+    "X-GitHub-Api-Version": "2022-11-28",
+})
+THEIRSTACK_HEADERS = MappingProxyType({
+    "Authorization": f"Bearer {THEIRSTACK_API_KEY}",
+    "Content-Type": "application/json",
+})
+BRAVE_HEADERS = MappingProxyType({
+    "X-Subscription-Token": BRAVE_API_KEY or "",
+    "Accept": "application/json",
+})
+
+# Sort rank for confidence labels (higher sorts first)
+CONF_ORDER = {"very_high": 4, "high": 3, "medium": 2, "low": 1, "none": 0}
+
+# Strongest signal confidence -> uses_claude verdict (no signals: "no evidence")
+CONFIDENCE_VERDICTS = {"very_high": "yes", "high": "likely", "medium": "possibly"}
+
+# batch_check_companies verdict -> summary bucket
+VERDICT_BUCKETS = {
+    "yes": "using",
+    "likely": "using",
+    "possibly": "possibly",
+    "no evidence": "none",
+    "unknown": "none",
+}
+
 # Signal weights for multi-source scoring
 SIGNAL_WEIGHTS = {
     "github_mcp_config": 40,
     "github_anthropic_sdk": 30,
     "github_api_key": 25,
+    "github_claude_action": 40,
     "npm_anthropic_dep": 35,
     "pypi_anthropic_dep": 35,
     "linkedin_post": 25,
@@ -46,6 +123,28 @@ SIGNAL_WEIGHTS = {
     "hackernews_mention": 15,
     "job_posting": 20,
 }
+# Best full_multi_source_scan score; it has no separate Claude Code Action signal
+MAX_POSSIBLE_SCORE = sum(
+    weight for signal, weight in SIGNAL_WEIGHTS.items() if signal != "github_claude_action"
+)
+
+# find_claude_companies_github scope -> weight of an org having that signal
+GITHUB_SCOPE_WEIGHTS = {
+    "mcp_configs": SIGNAL_WEIGHTS["github_mcp_config"],
+    "sdk_usage": SIGNAL_WEIGHTS["github_anthropic_sdk"],
+    "github_actions": SIGNAL_WEIGHTS["github_claude_action"],
+    "api_keys": SIGNAL_WEIGHTS["github_api_key"],
+}
+
+# Minimum weighted score for each confidence level above "low" (ascending, for
+# bisect): a score at or above SCORE_THRESHOLDS[i] earns SCORE_LEVELS[i + 1]
+SCORE_THRESHOLDS = (20, 40, 60)
+SCORE_LEVELS = ("low", "medium", "high", "very_high")
+
+
+def _score_confidence(score: int) -> str:
+    """Map a weighted signal score to a confidence level."""
+    return SCORE_LEVELS[bisect_right(SCORE_THRESHOLDS, score)]
 
 
 # ============ LINKEDIN HELPERS ============
@@ -97,28 +196,32 @@ async def _get_linkedin_session() -> tuple[str, str] | None:
     return None
 
 
-def get_linkedin_headers_sync(cookie: str, jsessionid: str) -> dict:
+# LinkedIn headers only change with the session, so each builder is memoized
+# and returns a read-only mapping (merge with | for per-request tweaks)
+@lru_cache(maxsize=1)
+def get_linkedin_headers_sync(cookie: str, jsessionid: str) -> MappingProxyType:
     """Build LinkedIn API headers with valid session."""
-    return {
+    return MappingProxyType({
         "cookie": f"{cookie}; JSESSIONID=\"{jsessionid}\"",
         "csrf-token": jsessionid,
         "x-li-lang": "en_US",
         "x-restli-protocol-version": "2.0.0",
         "accept": "application/vnd.linkedin.normalized+json+2.1",
         "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-    }
+    })
 
 
-def get_linkedin_headers() -> dict:
+@lru_cache(maxsize=1)
+def get_linkedin_headers() -> MappingProxyType:
     """Get headers for LinkedIn Voyager API calls (legacy sync version, may not work)."""
     if not LINKEDIN_COOKIE:
-        return {}
+        return MappingProxyType({})
 
     cookie = LINKEDIN_COOKIE
     if not cookie.startswith("li_at="):
         cookie = f"li_at={cookie}"
 
-    return {
+    return MappingProxyType({
         "cookie": f"{cookie}; JSESSIONID=ajax:0000000000000000000",
         "csrf-token": "ajax:0000000000000000000",
         "x-li-lang": "en_US",
@@ -126,7 +229,7 @@ def get_linkedin_headers() -> dict:
         "x-restli-protocol-version": "2.0.0",
         "accept": "application/vnd.linkedin.normalized+json+2.1",
         "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-    }
+    })
 
 CLAUDE_KEYWORDS = [
     "Claude",
@@ -144,30 +247,57 @@ HIGH_CONFIDENCE_KEYWORDS = [
     "Model Context Protocol",
 ]
 
+# Fixed part of the TheirStack job search; per-call knobs are merged in
+_JOB_BASE_PAYLOAD = MappingProxyType({
+    "job_description_pattern_or": CLAUDE_KEYWORDS,
+    "limit": 100,
+    "order_by": [{"field": "date_posted", "desc": True}],
+})
+
+# Single-pass keyword matcher: one regex alternation over every keyword
+# (longest first, so "Claude Code" is reported instead of "Claude")
+_KEYWORD_NAMES = {kw.lower(): kw for kw in CLAUDE_KEYWORDS + HIGH_CONFIDENCE_KEYWORDS}
+_HIGH_CONFIDENCE_LOWER = frozenset(kw.lower() for kw in HIGH_CONFIDENCE_KEYWORDS)
+_KEYWORD_RE = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(_KEYWORD_NAMES, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+# Relevance filters for HN results and LinkedIn job titles (one case-insensitive
+# regex scan per text). Short title terms are whole words, so "ai" and "ml"
+# don't match "Retail" or "HTML".
+_HN_RELEVANCE_RE = re.compile(r"claude|anthropic|mcp|model context protocol", re.IGNORECASE)
+_AI_TITLE_RE = re.compile(r"claude|anthropic|\b(?:llm|ai|ml)s?\b", re.IGNORECASE)
+
+# Company name -> likely LinkedIn slug ("Acme, Inc." -> "acme-inc")
+_LINKEDIN_SLUG_TABLE = str.maketrans({" ": "-", ".": None, ",": None})
+
+# Leading label of a CRM domain/website ("https://www.stripe.com/x" -> "stripe")
+_DOMAIN_RE = re.compile(r"^(?:https?://)?(?:www\.)?(?!https?://)([^/.:]+)", re.IGNORECASE)
+
+
+def _match_keywords(text: str) -> tuple[str, set[str]]:
+    """
+    Scan text once, case-insensitively, and return (confidence, matched keywords).
+    Only the hits are lowercased; map them through _KEYWORD_NAMES for display.
+    """
+    hits = {hit.lower() for hit in _KEYWORD_RE.findall(text)}
+    high = hits & _HIGH_CONFIDENCE_LOWER
+    if high:
+        return "high", high
+    return "medium", hits
+
 
 # ============ JOB POSTING TOOLS ============
 
-@mcp.tool()
-async def find_claude_companies_jobs(
+async def _find_claude_companies_jobs_impl(
     days_back: int = 30,
     min_employees: int = 50,
     max_employees: int = 10000,
     countries: str | None = None,
 ) -> dict:
-    """
-    Find companies mentioning Claude/Anthropic in job postings.
-    Best for discovering mid-market and enterprise adopters.
-    REQUIRES: TheirStack API key (optional - skip if not configured)
-
-    Args:
-        days_back: How many days back to search (default 30)
-        min_employees: Minimum company size (default 50)
-        max_employees: Maximum company size (default 10000)
-        countries: Comma-separated country codes (e.g., "US, GB, DE")
-
-    Returns:
-        Companies with Claude signals in their job postings
-    """
+    """Internal implementation for job posting search."""
     if not THEIRSTACK_API_KEY:
         return {
             "status": "skipped",
@@ -179,13 +309,10 @@ async def find_claude_companies_jobs(
 
     posted_after = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
 
-    payload = {
-        "job_description_pattern_or": CLAUDE_KEYWORDS,
+    payload = _JOB_BASE_PAYLOAD | {
         "posted_at_gte": posted_after,
         "company_num_employees_min": min_employees,
         "company_num_employees_max": max_employees,
-        "limit": 100,
-        "order_by": [{"field": "date_posted", "desc": True}],
     }
 
     if countries:
@@ -193,43 +320,34 @@ async def find_claude_companies_jobs(
         country_list = [c.strip().upper() for c in countries.split(",") if c.strip()]
         payload["job_country_code_or"] = country_list
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            f"{THEIRSTACK_BASE_URL}/jobs/search",
-            headers={
-                "Authorization": f"Bearer {THEIRSTACK_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
+    client = get_http_client()
+    response = await client.post(
+        f"{THEIRSTACK_BASE_URL}/jobs/search",
+        headers=THEIRSTACK_HEADERS,
+        content=orjson.dumps(payload),
+        timeout=60.0,
+    )
 
-        if response.status_code != 200:
-            return {"error": f"API error: {response.status_code}", "details": response.text}
+    if response.status_code != 200:
+        return {"error": f"API error: {response.status_code}", "details": response.text}
 
-        data = response.json()
+    # Keep only the job list; the raw body is released before scanning
+    jobs = orjson.loads(response.content).get("data", [])
+    del response
 
     # Process results
     companies = {}
-    for job in data.get("data", []):
+    for job in jobs:
         domain = job.get("company_domain", "unknown")
 
-        # Check confidence
-        text = f"{job.get('job_title', '')} {job.get('job_description', '')}".lower()
-        confidence = "medium"
-        matched = []
-
-        for kw in HIGH_CONFIDENCE_KEYWORDS:
-            if kw.lower() in text:
-                confidence = "high"
-                matched.append(kw)
+        # Check confidence (descriptions are dropped once scanned)
+        text = f"{job.get('job_title', '')} {job.pop('job_description', None) or ''}"
+        confidence, matched = _match_keywords(text)
 
-        if not matched:
-            for kw in CLAUDE_KEYWORDS:
-                if kw.lower() in text:
-                    matched.append(kw)
-
-        if domain not in companies:
-            companies[domain] = {
+        company = companies.get(domain)
+        if company is None:
+            # matched is a fresh set per job, so the first one seeds the keyword set
+            company = companies[domain] = {
                 "name": job.get("company_name"),
                 "domain": domain,
                 "employees": job.get("company_num_employees"),
@@ -237,57 +355,393 @@ async def find_claude_companies_jobs(
                 "country": job.get("company_country"),
                 "linkedin": job.get("company_linkedin_url"),
                 "jobs": [],
-                "keywords": set(),
+                "keywords": matched,
                 "confidence": confidence,
             }
+        else:
+            company["keywords"] |= matched
 
-        companies[domain]["jobs"].append({
+        company["jobs"].append({
             "title": job.get("job_title"),
             "url": job.get("job_url"),
             "posted": job.get("date_posted"),
         })
-        companies[domain]["keywords"].update(matched)
 
         if confidence == "high":
-            companies[domain]["confidence"] = "high"
+            company["confidence"] = "high"
 
-    # Format output
-    results = []
-    for c in companies.values():
-        c["keywords"] = list(c["keywords"])
+    # Format output in place, counting high-confidence companies on the way
+    results = list(companies.values())
+    high_confidence = 0
+    for c in results:
+        c["keywords"] = [_KEYWORD_NAMES[kw] for kw in c["keywords"]]
         c["job_count"] = len(c["jobs"])
-        results.append(c)
+        if c["confidence"] == "high":
+            high_confidence += 1
 
     # Sort by confidence then job count
     results.sort(key=lambda x: (x["confidence"] == "high", x["job_count"]), reverse=True)
 
     return {
         "found": len(results),
-        "high_confidence": len([r for r in results if r["confidence"] == "high"]),
+        "high_confidence": high_confidence,
         "companies": results,
     }
 
 
-# ============ GITHUB TOOLS ============
-
 @mcp.tool()
-async def find_claude_companies_github(
-    search_scope: str = "all",
+async def find_claude_companies_jobs(
+    days_back: int = 30,
+    min_employees: int = 50,
+    max_employees: int = 10000,
+    countries: str | None = None,
 ) -> dict:
     """
-    Find companies/orgs using Claude by searching GitHub code.
-    Looks for API keys, MCP configs, SDK usage, and GitHub Actions.
+    Find companies mentioning Claude/Anthropic in job postings.
+    Best for discovering mid-market and enterprise adopters.
+    REQUIRES: TheirStack API key (optional - skip if not configured)
 
     Args:
-        search_scope: "all", "mcp_configs", "sdk_usage", or "github_actions"
+        days_back: How many days back to search (default 30)
+        min_employees: Minimum company size (default 50)
+        max_employees: Maximum company size (default 10000)
+        countries: Comma-separated country codes (e.g., "US, GB, DE")
 
     Returns:
-        Organizations and repos with Claude code signals
+        Companies with Claude signals in their job postings
     """
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    if GITHUB_TOKEN:
-        headers["Authorization"] = f"token {GITHUB_TOKEN}"
-    else:
+    return await _find_claude_companies_jobs_impl(days_back, min_employees, max_employees, countries)
+
+
+# ============ GITHUB TOOLS ============
+
+# Cap on concurrent GitHub code searches, plus a rate limiter matching the
+# search API quota (30 requests/min for authenticated users)
+_github_search_semaphore = asyncio.Semaphore(5)
+_github_search_limiter = AsyncLimiter(30, 60)
+
+# Companies checked in parallel by batch_check_companies
+BATCH_CONCURRENCY = 5
+
+# Largest page size GitHub's search API accepts
+GITHUB_MAX_PER_PAGE = 100
+
+
+# GitHub response caches. Successful GETs are kept for GITHUB_CACHE_TTL seconds;
+# after that they are revalidated with If-None-Match, and a 304 reuses the body.
+# Dict order doubles as recency: hits move to the back, eviction pops the front.
+GITHUB_CACHE_TTL = 600.0
+_GITHUB_CACHE_MAX_ENTRIES = 2048
+_github_response_cache: dict[str, tuple[float, str | None, dict]] = {}
+
+# Org resolution results: company -> (expires_at, in-flight or finished future).
+# Concurrent callers asking for the same company share one lookup.
+_github_org_cache: dict[str, tuple[float, asyncio.Future]] = {}
+
+# Companies whose org had zero Claude signals on a complete batch check:
+# company -> (expires_at, org_name). Most CRM rows are misses, so re-checks skip GitHub.
+GITHUB_NEGATIVE_TTL = 24 * 3600.0
+_github_negative_cache: dict[str, tuple[float, str]] = {}
+
+# full_multi_source_scan per-source results: "source:company" -> (expires_at, future).
+# Repeat scans of a company within an interactive session skip the fan-out.
+SCAN_CACHE_TTL = 900.0
+_scan_cache: dict[str, tuple[float, asyncio.Future]] = {}
+
+
+def _clear_github_caches() -> None:
+    """
+    Drop memoized GitHub lookups (called on rate limiting so misses aren't cached).
+    Stored 200 bodies and their ETags are kept: a 304 revalidation doesn't count
+    against the rate limit, so they are most useful right after being limited.
+    """
+    _github_org_cache.clear()
+    _github_negative_cache.clear()
+    # Other full_multi_source_scan sources don't use GitHub quota; keep them
+    for key in [k for k in _scan_cache if k.startswith("github:")]:
+        del _scan_cache[key]
+
+
+def _is_github_rate_limited(resp: httpx.Response) -> bool:
+    """
+    Whether a GitHub response is a rate limit: a 429, or a 403 carrying
+    retry-after or an exhausted x-ratelimit-remaining (not a plain Forbidden,
+    e.g. an SSO-protected org).
+    """
+    if resp.status_code == 429:
+        return True
+    return resp.status_code == 403 and (
+        "retry-after" in resp.headers or resp.headers.get("x-ratelimit-remaining") == "0"
+    )
+
+
+def _github_cache_key(path: str, params: dict | None) -> str:
+    return f"{path}?{urlencode(sorted(params.items()))}" if params else path
+
+
+def _github_fresh_cached(path: str, params: dict | None = None) -> dict | None:
+    """Return a cached body for this GET if it is still within its TTL."""
+    key = _github_cache_key(path, params)
+    cached = _github_response_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        del _github_response_cache[key]
+        _github_response_cache[key] = cached
+        return cached[2]
+    return None
+
+
+async def _github_get_json(path: str, params: dict | None = None) -> tuple[int, dict]:
+    """
+    GET a GitHub API path and return (status_code, json_body).
+    200 responses are cached per URL; non-200 responses return an empty body.
+    """
+    fresh = _github_fresh_cached(path, params)
+    if fresh is not None:
+        return 200, fresh
+
+    key = _github_cache_key(path, params)
+    now = time.monotonic()
+    cached = _github_response_cache.get(key)
+
+    headers = GITHUB_HEADERS
+    if cached and cached[1]:
+        headers = GITHUB_HEADERS | {"If-None-Match": cached[1]}
+
+    resp = await get_http_client().get(f"{GITHUB_API}{path}", params=params, headers=headers)
+
+    if resp.status_code == 304 and cached:
+        # Re-insert so the revalidated entry counts as most recently used
+        _github_response_cache.pop(key, None)
+        _github_response_cache[key] = (now + GITHUB_CACHE_TTL, cached[1], cached[2])
+        return 200, cached[2]
+
+    if resp.status_code == 200:
+        data = orjson.loads(resp.content)
+        if len(_github_response_cache) >= _GITHUB_CACHE_MAX_ENTRIES:
+            del _github_response_cache[next(iter(_github_response_cache))]
+        _github_response_cache[key] = (now + GITHUB_CACHE_TTL, resp.headers.get("etag"), data)
+        return 200, data
+
+    if _is_github_rate_limited(resp):
+        _clear_github_caches()
+    return resp.status_code, {}
+
+
+async def _search_github_code(query: str, per_page: int, page: int = 1) -> tuple[int, dict]:
+    """Run one GitHub code search, bounded by the shared search semaphore and limiter."""
+    params = {"q": query, "per_page": per_page}
+    if page > 1:
+        params["page"] = page
+
+    # Cache hits skip the semaphore and limiter, so they cost no search quota
+    cached = _github_fresh_cached("/search/code", params)
+    if cached is not None:
+        return 200, cached
+
+    async with _github_search_semaphore, _github_search_limiter:
+        return await _github_get_json("/search/code", params)
+
+
+async def _search_github_code_pages(
+    query: str,
+    per_page: int = GITHUB_MAX_PER_PAGE,
+    max_pages: int = 3,
+) -> tuple[int, list[dict], bool]:
+    """
+    Run a GitHub code search and follow result pages up to max_pages.
+    Returns (status_code, items, truncated); truncated is True when GitHub
+    reported more matches than were fetched.
+    """
+    items = []
+    total = 0
+
+    for page in range(1, max_pages + 1):
+        status, data = await _search_github_code(query, per_page, page)
+        if status != 200:
+            if page == 1:
+                return status, [], False
+            return 200, items, True
+
+        page_items = data.get("items", [])
+        items.extend(page_items)
+        total = data.get("total_count", 0)
+
+        if len(page_items) < per_page or len(items) >= total:
+            return 200, items, False
+
+    return 200, items, len(items) < total
+
+
+async def _ttl_cached(cache: dict, key: str, factory, ttl: float = GITHUB_CACHE_TTL):
+    """
+    Return the memoized result of factory() for key, fetching it at most once per
+    ttl seconds. Used for GitHub org resolution, npm package checks and the
+    per-source results of full_multi_source_scan.
+    """
+    now = time.monotonic()
+    entry = cache.get(key)
+
+    if entry is None or entry[0] <= now:
+        if len(cache) >= _GITHUB_CACHE_MAX_ENTRIES:
+            for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+                del cache[stale]
+            # Everything still live: drop the oldest entry to stay within the bound
+            if len(cache) >= _GITHUB_CACHE_MAX_ENTRIES:
+                del cache[next(iter(cache))]
+        entry = (now + ttl, asyncio.ensure_future(factory()))
+        cache[key] = entry
+
+    try:
+        return await asyncio.shield(entry[1])
+    except Exception:
+        if cache.get(key) is entry:
+            del cache[key]
+        raise
+
+
+_GITHUB_GRAPHQL_HEADERS = MappingProxyType(GITHUB_HEADERS | {"Content-Type": "application/json"})
+# Org fields fetched by _graphql_orgs, covering the REST /orgs keys callers read
+_ORG_GRAPHQL_FIELDS = "name description websiteUrl repositories(privacy: PUBLIC) { totalCount }"
+
+
+async def _graphql_orgs(logins: list[str]) -> list[dict | None] | None:
+    """
+    Look up several orgs in one GraphQL request. Returns REST-shaped org data per
+    login (None where the org doesn't exist), or None if the request failed.
+    """
+    variables = {f"l{i}": login for i, login in enumerate(logins)}
+    params = ", ".join(f"${name}: String!" for name in variables)
+    aliases = " ".join(
+        f"o{i}: organization(login: $l{i}) {{ {_ORG_GRAPHQL_FIELDS} }}"
+        for i in range(len(logins))
+    )
+    query = f"query({params}) {{ {aliases} }}"
+
+    try:
+        resp = await get_http_client().post(
+            f"{GITHUB_API}/graphql",
+            content=orjson.dumps({"query": query, "variables": variables}),
+            headers=_GITHUB_GRAPHQL_HEADERS,
+        )
+        data = orjson.loads(resp.content).get("data") if resp.status_code == 200 else None
+    except (httpx.HTTPError, orjson.JSONDecodeError):
+        return None
+    if not data:
+        return None
+
+    # Missing orgs come back as null aliases (with a NOT_FOUND error alongside)
+    orgs = []
+    for i in range(len(logins)):
+        org = data.get(f"o{i}")
+        orgs.append(org and {
+            "name": org.get("name"),
+            "description": org.get("description"),
+            "blog": org.get("websiteUrl"),
+            "public_repos": (org.get("repositories") or {}).get("totalCount"),
+        })
+    return orgs
+
+
+# Strips separators in one pass: "Acme-Labs.io" -> "acmelabsio" (after lowering)
+_ORG_NAME_SQUASH = str.maketrans("", "", " -.")
+
+
+async def _lookup_github_org(company: str) -> tuple[str, dict] | None:
+    """Find the GitHub org for a company by trying its name and common variations."""
+    lowered = company.lower().strip()
+    candidates = [
+        lowered.translate(_ORG_NAME_SQUASH),
+        lowered,
+        lowered.replace(" ", "-"),
+        f"{lowered}hq",
+        f"{lowered}-inc",
+    ]
+
+    # Look up every variant at once and take the first one, in preference order,
+    # that exists: one GraphQL request, or per-variant REST lookups (core quota,
+    # not the search quota) if GraphQL fails
+    candidates = list(dict.fromkeys(candidates))
+    found = await _graphql_orgs(candidates)
+    if found is None:
+        responses = await asyncio.gather(
+            *(_github_get_json(f"/orgs/{candidate}") for candidate in candidates)
+        )
+        found = [data if status == 200 else None for status, data in responses]
+
+    for candidate, data in zip(candidates, found):
+        if data is not None:
+            return candidate, data
+
+    return None
+
+
+async def _resolve_github_org(company: str) -> tuple[str, dict] | None:
+    """Cached wrapper around _lookup_github_org, returning (org_login, org_data)."""
+    return await _ttl_cached(
+        _github_org_cache,
+        company.lower().strip(),
+        lambda: _lookup_github_org(company),
+    )
+
+
+# Per-org Claude signal searches. The quick checks (batch_check_companies and
+# does_company_use_claude) all go through _probe_org_signal with the same query
+# text and page size, so a search run by one is a cache hit for the other.
+ORG_SIGNAL_QUERIES = {
+    "mcp_config": "org:{org} filename:.mcp.json",
+    "claude_action": "org:{org} claude-code-action path:.github",
+    "api_key": "org:{org} ANTHROPIC_API_KEY",
+    "anthropic_sdk": 'org:{org} "@anthropic-ai/sdk"',
+    "python_import": 'org:{org} "from anthropic import"',
+    "claude_api": 'org:{org} "claude" "api"',
+}
+_ORG_PROBE_PER_PAGE = 5
+
+# (signal, label, confidence) checks per tool, highest value first
+BATCH_ORG_CHECKS = (
+    ("mcp_config", "MCP config", "very_high"),
+    ("api_key", "API key ref", "high"),
+    ("anthropic_sdk", "SDK usage", "high"),
+)
+DEEP_ORG_CHECKS = (
+    ("mcp_config", "MCP config file", "very_high"),
+    ("claude_action", "Claude Code GitHub Action", "very_high"),
+    ("api_key", "Anthropic API key reference", "high"),
+    ("anthropic_sdk", "Anthropic SDK usage", "high"),
+    ("python_import", "Anthropic Python import", "high"),
+    ("claude_api", "Claude API mention", "medium"),
+)
+# does_company_use_claude runs the very_high checks first; if one hits, the
+# verdict is settled and the rest are skipped to save rate-limit budget
+_DEEP_ORG_PHASES = (
+    tuple(c for c in DEEP_ORG_CHECKS if c[2] == "very_high"),
+    tuple(c for c in DEEP_ORG_CHECKS if c[2] != "very_high"),
+)
+# analyze_org_claude_usage: (signal, breakdown key)
+ANALYZE_ORG_SIGNALS = (
+    ("mcp_config", "mcp"),
+    ("anthropic_sdk", "sdk"),
+    ("claude_action", "actions"),
+    ("api_key", "api_keys"),
+)
+
+
+async def _probe_org_signal(org_name: str, signal: str) -> tuple[int, dict]:
+    """Run one ORG_SIGNAL_QUERIES search for an org and return (status_code, json_body)."""
+    return await _search_github_code(
+        ORG_SIGNAL_QUERIES[signal].format(org=org_name), _ORG_PROBE_PER_PAGE
+    )
+
+
+async def _count_org_signal(org_name: str, signal: str) -> int | None:
+    """total_count for an org signal search (None on any error)."""
+    status, data = await _probe_org_signal(org_name, signal)
+    return data.get("total_count", 0) if status == 200 else None
+
+
+async def _find_claude_companies_github_impl(search_scope: str = "all", max_pages: int = 3) -> dict:
+    """Internal implementation for GitHub code search."""
+    if not GITHUB_TOKEN:
         return {
             "warning": "No GITHUB_TOKEN - rate limited to 10 requests/min",
             "setup": "Create token at https://github.com/settings/tokens",
@@ -313,113 +767,148 @@ async def find_claude_companies_github(
         all_queries = queries[search_scope]
     else:
         return {"error": f"Invalid scope. Use: all, {', '.join(queries.keys())}"}
+    query_scopes = {q: scope for scope, qs in queries.items() for q in qs}
 
-    repos = []
+    unique_repos: dict[str, dict] = {}
     orgs = {}
+    truncated = False
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for query in all_queries:
-            response = await client.get(
-                f"{GITHUB_API}/search/code",
-                params={"q": query, "per_page": 50},
-                headers=headers,
-            )
+    responses = await asyncio.gather(
+        *(_search_github_code_pages(query, max_pages=max_pages) for query in all_queries),
+        return_exceptions=True,
+    )
 
-            if response.status_code == 403:
-                return {"error": "Rate limited. Wait or add GITHUB_TOKEN."}
-            if response.status_code != 200:
+    for query, response in zip(all_queries, responses):
+        if isinstance(response, Exception):
+            continue
+        status, items, query_truncated = response
+        if status == 403:
+            return {"error": "Rate limited. Wait or add GITHUB_TOKEN."}
+        if status != 200:
+            continue
+        truncated = truncated or query_truncated
+
+        for item in items:
+            repo = item.get("repository", {})
+            full_name = repo.get("full_name")
+            owner = repo.get("owner", {})
+
+            # Every hit counts toward its org's signal types
+            org = None
+            if owner.get("type") == "Organization":
+                login = owner.get("login")
+                org = orgs.get(login)
+                if org is None:
+                    org = orgs[login] = {"name": login, "repos": [], "signals": set()}
+                org["signals"].add(query_scopes[query])
+
+            # Dedupe on insert: keep the first hit per repo
+            if full_name in unique_repos:
                 continue
 
-            for item in response.json().get("items", []):
-                repo = item.get("repository", {})
-                owner = repo.get("owner", {})
-
-                repos.append({
-                    "repo": repo.get("full_name"),
-                    "url": repo.get("html_url"),
-                    "owner": owner.get("login"),
-                    "owner_type": owner.get("type"),
-                    "file": item.get("path"),
-                    "signal": query.split()[0],
-                })
-
-                if owner.get("type") == "Organization":
-                    org = owner.get("login")
-                    if org not in orgs:
-                        orgs[org] = {"name": org, "repos": []}
-                    if repo.get("full_name") not in orgs[org]["repos"]:
-                        orgs[org]["repos"].append(repo.get("full_name"))
+            unique_repos[full_name] = {
+                "repo": full_name,
+                "url": repo.get("html_url"),
+                "owner": owner.get("login"),
+                "owner_type": owner.get("type"),
+                "file": item.get("path"),
+                "signal": query.split()[0],
+            }
 
-    # Dedupe
-    seen = set()
-    unique_repos = []
-    for r in repos:
-        if r["repo"] not in seen:
-            seen.add(r["repo"])
-            unique_repos.append(r)
+            if org is not None:
+                org["repos"].append(full_name)
 
     return {
         "repos_found": len(unique_repos),
         "orgs_found": len(orgs),
-        "organizations": [{"name": k, "repo_count": len(v["repos"]), "repos": v["repos"]}
-                         for k, v in orgs.items()],
-        "sample_repos": unique_repos[:30],
+        "truncated": truncated,
+        "organizations": [
+            {
+                "name": k,
+                "repo_count": len(v["repos"]),
+                "signals": sorted(v["signals"]),
+                "repos": v["repos"],
+            }
+            for k, v in orgs.items()
+        ],
+        "sample_repos": list(unique_repos.values())[:30],
     }
 
 
 @mcp.tool()
-async def analyze_org_claude_usage(org_name: str) -> dict:
+async def find_claude_companies_github(
+    search_scope: str = "all",
+    max_pages: int = 3,
+) -> dict:
+    """
+    Find companies/orgs using Claude by searching GitHub code.
+    Looks for API keys, MCP configs, SDK usage, and GitHub Actions.
+
+    Args:
+        search_scope: "all", "mcp_configs", "sdk_usage", or "github_actions"
+        max_pages: Result pages (100 hits each) to fetch per query (default 3).
+                   Higher values find more orgs but use more search quota.
+
+    Returns:
+        Organizations and repos with Claude code signals
+        ("truncated" is true when some query had more matches than fetched)
+    """
+    return await _find_claude_companies_github_impl(search_scope, max_pages)
+
+
+@mcp.tool()
+async def analyze_org_claude_usage(org_name: str, max_pages: int = 2) -> dict:
     """
     Deep-dive into a specific GitHub org's Claude/Anthropic usage.
 
     Args:
         org_name: GitHub organization name (e.g., 'stripe', 'vercel')
+        max_pages: Result pages (100 hits each) to fetch per signal search (default 2)
 
     Returns:
         Detailed analysis of Claude signals in the org
+        ("truncated" is true when some search had more matches than fetched)
     """
     if not GITHUB_TOKEN:
         return {"error": "GITHUB_TOKEN required for org analysis"}
 
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "Authorization": f"token {GITHUB_TOKEN}",
-    }
-
     signals = {"mcp": [], "sdk": [], "actions": [], "api_keys": []}
+    truncated = False
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Search within org
-        searches = [
-            (f"org:{org_name} filename:.mcp.json", "mcp"),
-            (f'org:{org_name} "@anthropic-ai/sdk"', "sdk"),
-            (f"org:{org_name} claude-code-action path:.github", "actions"),
-            (f"org:{org_name} ANTHROPIC_API_KEY", "api_keys"),
-        ]
+    # Search within org
+    searches = [
+        (ORG_SIGNAL_QUERIES[signal].format(org=org_name), signal_type)
+        for signal, signal_type in ANALYZE_ORG_SIGNALS
+    ]
 
-        for query, signal_type in searches:
-            resp = await client.get(
-                f"{GITHUB_API}/search/code",
-                params={"q": query, "per_page": 20},
-                headers=headers,
-            )
-            if resp.status_code == 200:
-                for item in resp.json().get("items", []):
-                    signals[signal_type].append({
-                        "repo": item.get("repository", {}).get("full_name"),
-                        "file": item.get("path"),
-                    })
+    # The org info lookup uses the core quota, so it runs alongside the searches
+    org_response, *responses = await asyncio.gather(
+        _github_get_json(f"/orgs/{org_name}"),
+        *(_search_github_code_pages(query, max_pages=max_pages) for query, _ in searches),
+        return_exceptions=True,
+    )
 
-        # Get org info
-        org_resp = await client.get(f"{GITHUB_API}/orgs/{org_name}", headers=headers)
-        org_info = {}
-        if org_resp.status_code == 200:
-            d = org_resp.json()
-            org_info = {
-                "name": d.get("name"),
-                "blog": d.get("blog"),
-                "public_repos": d.get("public_repos"),
-            }
+    for (_, signal_type), resp in zip(searches, responses):
+        if isinstance(resp, Exception):
+            continue
+        status, items, search_truncated = resp
+        if status == 200:
+            truncated = truncated or search_truncated
+            for item in items:
+                signals[signal_type].append({
+                    "repo": item.get("repository", {}).get("full_name"),
+                    "file": item.get("path"),
+                })
+
+    # Org info
+    org_info = {}
+    if not isinstance(org_response, Exception) and org_response[0] == 200:
+        d = org_response[1]
+        org_info = {
+            "name": d.get("name"),
+            "blog": d.get("blog"),
+            "public_repos": d.get("public_repos"),
+        }
 
     total = sum(len(v) for v in signals.values())
 
@@ -430,6 +919,7 @@ async def analyze_org_claude_usage(org_name: str) -> dict:
         "using_claude": total > 0,
         "confidence": "high" if total > 2 else "medium" if total > 0 else "none",
         "breakdown": {k: len(v) for k, v in signals.items()},
+        "truncated": truncated,
         "details": signals,
     }
 
@@ -452,233 +942,221 @@ async def full_claude_company_scan(
         include_github: Whether to include GitHub search
 
     Returns:
-        Combined results from all sources with deduplication
+        Combined results from all sources with deduplication, plus an "errors"
+        map of any source that failed
     """
-    results = {
-        "job_signals": {},
-        "github_signals": {},
-        "combined_companies": [],
-    }
+    # Job posting and GitHub searches hit different APIs, so run them together
+    # (a disabled source resolves immediately to an empty result). A source that
+    # raises is reported under "errors" without discarding the other's results.
+    results = await asyncio.gather(
+        _find_claude_companies_jobs_impl(days_back=days_back, min_employees=min_employees)
+        if THEIRSTACK_API_KEY else asyncio.sleep(0, result={}),
+        _find_claude_companies_github_impl(search_scope="all")
+        if include_github and GITHUB_TOKEN else asyncio.sleep(0, result={}),
+        return_exceptions=True,
+    )
+    errors = {}
+    for source, result in zip(("job_postings", "github"), results):
+        if isinstance(result, BaseException):
+            errors[source] = str(result) or type(result).__name__
+    job_results, gh_results = (
+        {} if isinstance(result, BaseException) else result for result in results
+    )
 
-    # Job posting search
-    if THEIRSTACK_API_KEY:
-        job_results = await find_claude_companies_jobs(
-            days_back=days_back,
-            min_employees=min_employees,
-        )
-        if "companies" in job_results:
-            for c in job_results["companies"]:
-                domain = c.get("domain", "").lower()
-                if domain:
-                    results["job_signals"][domain] = c
-
-    # GitHub search
-    if include_github and GITHUB_TOKEN:
-        gh_results = await find_claude_companies_github(search_scope="all")
-        if "organizations" in gh_results:
-            for org in gh_results["organizations"]:
-                # Try to match org name to domain (imperfect but helpful)
-                org_name = org["name"].lower()
-                results["github_signals"][org_name] = org
-
-    # Combine and dedupe
-    all_domains = set(results["job_signals"].keys()) | set(results["github_signals"].keys())
-
-    for domain in all_domains:
-        job_data = results["job_signals"].get(domain, {})
-        gh_data = results["github_signals"].get(domain, {})
-
-        combined = {
+    # Combine and dedupe in one pass per source, keyed by domain / org name.
+    # Score = sum of SIGNAL_WEIGHTS for the signals seen; postings that name
+    # Claude Code/Desktop or the API directly count double
+    combined: dict[str, dict] = {}
+    from_jobs = from_github = multi_source = 0
+
+    for job_data in job_results.get("companies", []):
+        domain = job_data.get("domain", "").lower()
+        if not domain:
+            continue
+        if domain not in combined:
+            from_jobs += 1
+        job_score = SIGNAL_WEIGHTS["job_posting"]
+        if job_data.get("confidence") == "high":
+            job_score *= 2
+        combined[domain] = {
             "identifier": domain,
-            "name": job_data.get("name") or gh_data.get("name", domain),
+            "name": job_data.get("name") or domain,
             "domain": job_data.get("domain"),
             "employees": job_data.get("employees"),
             "industry": job_data.get("industry"),
-            "sources": [],
-            "confidence": "low",
+            "sources": ["job_postings"],
+            "score": job_score,
+            "job_count": job_data.get("job_count", 0),
+            "job_keywords": job_data.get("keywords", []),
         }
 
-        if job_data:
-            combined["sources"].append("job_postings")
-            combined["job_count"] = job_data.get("job_count", 0)
-            combined["job_keywords"] = job_data.get("keywords", [])
-
-        if gh_data:
-            combined["sources"].append("github")
-            combined["github_repos"] = gh_data.get("repo_count", 0)
-
-        # Calculate confidence
-        if len(combined["sources"]) > 1:
-            combined["confidence"] = "very_high"
-        elif job_data.get("confidence") == "high":
-            combined["confidence"] = "high"
-        elif job_data or gh_data:
-            combined["confidence"] = "medium"
-
-        results["combined_companies"].append(combined)
-
-    # Sort by confidence
-    conf_order = {"very_high": 4, "high": 3, "medium": 2, "low": 1}
-    results["combined_companies"].sort(
-        key=lambda x: conf_order.get(x["confidence"], 0),
-        reverse=True,
-    )
+    for gh_data in gh_results.get("organizations", []):
+        # Try to match org name to domain (imperfect but helpful)
+        org_name = gh_data["name"].lower()
+        gh_score = sum(GITHUB_SCOPE_WEIGHTS[scope] for scope in gh_data.get("signals", []))
+        entry = combined.get(org_name)
+        if entry is None:
+            from_github += 1
+            combined[org_name] = {
+                "identifier": org_name,
+                "name": gh_data.get("name", org_name),
+                "domain": None,
+                "employees": None,
+                "industry": None,
+                "sources": ["github"],
+                "score": gh_score,
+                "github_repos": gh_data.get("repo_count", 0),
+            }
+        elif "github" not in entry["sources"]:
+            from_github += 1
+            multi_source += 1
+            entry["sources"].append("github")
+            entry["score"] += gh_score
+            entry["github_repos"] = gh_data.get("repo_count", 0)
+
+    # Sort by score, then bucket each company's score into a confidence level
+    companies = sorted(combined.values(), key=itemgetter("score"), reverse=True)
+    for c in companies:
+        c["confidence"] = _score_confidence(c["score"])
 
     return {
-        "total_companies": len(results["combined_companies"]),
-        "from_jobs": len(results["job_signals"]),
-        "from_github": len(results["github_signals"]),
-        "multi_source": len([c for c in results["combined_companies"] if len(c["sources"]) > 1]),
-        "companies": results["combined_companies"],
+        "total_companies": len(companies),
+        "from_jobs": from_jobs,
+        "from_github": from_github,
+        "multi_source": multi_source,
+        "companies": companies,
+        "errors": errors,
     }
 
 
-@mcp.tool()
-async def batch_check_companies(
-    companies: str,
+async def _batch_check_companies_impl(
+    company_list: list[str],
     include_evidence: bool = False,
 ) -> dict:
-    """
-    Check multiple companies for Claude usage in one batch call.
-    Perfect for enriching CRM data from HubSpot, Salesforce, etc.
-
-    Args:
-        companies: Comma-separated company names or GitHub orgs (e.g., "stripe, vercel, shopify")
-        include_evidence: Include detailed evidence (slower, more data)
-
-    Returns:
-        Results for each company with Claude usage verdict
-
-    Example workflow with HubSpot:
-        1. Ask Claude: "Get all my companies from HubSpot"
-        2. Then: "Check which of these use Claude"
-        3. Or combined: "Get my HubSpot companies and check which use Claude"
-    """
+    """Internal implementation for batch company checks."""
     if not GITHUB_TOKEN:
         return {"error": "GITHUB_TOKEN required"}
 
-    if not companies:
-        return {"error": "No companies provided", "hint": "Pass a comma-separated list of company names"}
-
-    # Parse comma-separated companies to list
-    company_list = [c.strip() for c in companies.split(",") if c.strip()]
-
     if len(company_list) > 50:
         return {
             "error": f"Too many companies ({len(company_list)}). Max 50 per batch.",
             "hint": "Split into smaller batches",
         }
 
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "Authorization": f"token {GITHUB_TOKEN}",
-    }
-
-    results = []
-    checked = 0
-    found_using_claude = 0
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for company in company_list:
-            checked += 1
-
-            # Normalize company name
-            org_name = company.lower().strip().replace(" ", "").replace("-", "").replace(".", "")
-
-            # Quick org lookup
-            org_resp = await client.get(f"{GITHUB_API}/orgs/{org_name}", headers=headers)
-
-            if org_resp.status_code != 200:
-                # Try variations
-                found = False
-                for var in [company.lower(), company.replace(" ", "-").lower(), f"{company.lower()}hq"]:
-                    resp = await client.get(f"{GITHUB_API}/orgs/{var}", headers=headers)
-                    if resp.status_code == 200:
-                        org_name = var
-                        found = True
-                        break
-
-                if not found:
-                    results.append({
-                        "company": company,
-                        "github_org": None,
-                        "uses_claude": "unknown",
-                        "confidence": "none",
-                        "reason": "GitHub org not found",
-                    })
-                    continue
+    company_semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def check_one(company: str) -> dict:
+        # Recently confirmed misses skip every GitHub call
+        negative_key = company.lower()
+        cached_miss = _github_negative_cache.get(negative_key)
+        if cached_miss is not None:
+            if cached_miss[0] > time.monotonic():
+                return {
+                    "company": company,
+                    "github_org": cached_miss[1],
+                    "uses_claude": "no evidence",
+                    "confidence": "none",
+                    "_rank": CONF_ORDER["none"],
+                    "signals": [],
+                    "cached": True,
+                }
+            del _github_negative_cache[negative_key]
+
+        async with company_semaphore:
+            # Org lookup (name + common variations, cached across calls)
+            org = await _resolve_github_org(company)
+            if org is None:
+                return {
+                    "company": company,
+                    "github_org": None,
+                    "uses_claude": "unknown",
+                    "confidence": "none",
+                    "_rank": CONF_ORDER["none"],
+                    "reason": "GitHub org not found",
+                }
+            org_name = org[0]
 
             # Quick signal check (prioritize high-value signals)
             signals = []
-            searches = [
-                (f"org:{org_name} filename:.mcp.json", "MCP config", "very_high"),
-                (f"org:{org_name} ANTHROPIC_API_KEY", "API key ref", "high"),
-                (f'org:{org_name} "@anthropic-ai/sdk"', "SDK usage", "high"),
-            ]
-
-            for query, signal_name, confidence in searches:
-                try:
-                    resp = await client.get(
-                        f"{GITHUB_API}/search/code",
-                        params={"q": query, "per_page": 1},
-                        headers=headers,
-                    )
-                    if resp.status_code == 200 and resp.json().get("total_count", 0) > 0:
-                        signals.append({"signal": signal_name, "confidence": confidence})
-
-                        # If we found a very high signal, we can stop early
-                        if confidence == "very_high":
-                            break
-                except Exception:
-                    continue
-
-            # Determine verdict
-            if any(s["confidence"] == "very_high" for s in signals):
-                verdict = "yes"
-                conf = "very_high"
-                found_using_claude += 1
-            elif any(s["confidence"] == "high" for s in signals):
-                verdict = "likely"
-                conf = "high"
-                found_using_claude += 1
-            elif signals:
-                verdict = "possibly"
-                conf = "medium"
-            else:
-                verdict = "no evidence"
-                conf = "none"
-
-            result = {
-                "company": company,
-                "github_org": org_name,
-                "uses_claude": verdict,
-                "confidence": conf,
-                "signals": [s["signal"] for s in signals],
+            conf = "none"
+            complete = True
+            searches = BATCH_ORG_CHECKS
+
+            # Run the searches together; a very high hit settles the verdict, so
+            # the searches still in flight are cancelled
+            tasks = {
+                asyncio.ensure_future(_count_org_signal(org_name, signal)): i
+                for i, (signal, _, _) in enumerate(searches)
             }
+            hits = set()
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        count = None if task.exception() else task.result()
+                        if count is None:
+                            complete = False
+                        elif count > 0:
+                            hits.add(tasks[task])
+                    if any(searches[i][2] == "very_high" for i in hits):
+                        break
+            finally:
+                for task in pending:
+                    task.cancel()
+
+            # Report signals in search (priority) order, tracking the strongest
+            for i, (_, signal_name, confidence) in enumerate(searches):
+                if i in hits:
+                    signals.append({"signal": signal_name, "confidence": confidence})
+                    if CONF_ORDER[confidence] > CONF_ORDER[conf]:
+                        conf = confidence
+
+            # Only remember a miss when every search actually answered
+            if not signals and complete:
+                now = time.monotonic()
+                if len(_github_negative_cache) >= _GITHUB_CACHE_MAX_ENTRIES:
+                    for stale in [
+                        k for k, (expires, _) in _github_negative_cache.items() if expires <= now
+                    ]:
+                        del _github_negative_cache[stale]
+                    # Everything still live: drop the oldest entry to stay within the bound
+                    if len(_github_negative_cache) >= _GITHUB_CACHE_MAX_ENTRIES:
+                        del _github_negative_cache[next(iter(_github_negative_cache))]
+                _github_negative_cache[negative_key] = (now + GITHUB_NEGATIVE_TTL, org_name)
+
+        # Determine verdict from the strongest signal
+        verdict = CONFIDENCE_VERDICTS.get(conf, "no evidence")
+
+        result = {
+            "company": company,
+            "github_org": org_name,
+            "uses_claude": verdict,
+            "confidence": conf,
+            "_rank": CONF_ORDER[conf],
+            "signals": [s["signal"] for s in signals],
+        }
 
-            if include_evidence and signals:
-                result["signal_details"] = signals
-
-            results.append(result)
+        if include_evidence and signals:
+            result["signal_details"] = signals
 
-            # Rate limit: GitHub allows 30 search requests/minute
-            # We do up to 3 searches per company, so ~10 companies/minute safe
-            if checked % 10 == 0:
-                import asyncio
-                await asyncio.sleep(2)  # Brief pause every 10 companies
+        return result
 
-    # Sort by confidence
-    conf_order = {"very_high": 4, "high": 3, "medium": 2, "none": 1}
-    results.sort(key=lambda x: conf_order.get(x["confidence"], 0), reverse=True)
+    results = await asyncio.gather(*(check_one(company) for company in company_list))
 
-    # Separate into categories for easy reading
-    using_claude = [r for r in results if r["uses_claude"] in ("yes", "likely")]
-    possibly = [r for r in results if r["uses_claude"] == "possibly"]
-    no_evidence = [r for r in results if r["uses_claude"] in ("no evidence", "unknown")]
+    # Sort by confidence, then separate into categories in one pass
+    results.sort(key=itemgetter("_rank"), reverse=True)
+    buckets = {"using": [], "possibly": [], "none": []}
+    for r in results:
+        del r["_rank"]
+        buckets[VERDICT_BUCKETS[r["uses_claude"]]].append(r)
+    using_claude, possibly, no_evidence = buckets["using"], buckets["possibly"], buckets["none"]
 
     return {
         "summary": {
-            "total_checked": len(companies),
+            "total_checked": len(company_list),
             "using_claude": len(using_claude),
             "possibly_using": len(possibly),
             "no_evidence": len(no_evidence),
@@ -690,6 +1168,36 @@ async def batch_check_companies(
     }
 
 
+@mcp.tool()
+async def batch_check_companies(
+    companies: str,
+    include_evidence: bool = False,
+) -> dict:
+    """
+    Check multiple companies for Claude usage in one batch call.
+    Perfect for enriching CRM data from HubSpot, Salesforce, etc.
+
+    Args:
+        companies: Comma-separated company names or GitHub orgs (e.g., "stripe, vercel, shopify")
+        include_evidence: Include detailed evidence (slower, more data)
+
+    Returns:
+        Results for each company with Claude usage verdict
+
+    Example workflow with HubSpot:
+        1. Ask Claude: "Get all my companies from HubSpot"
+        2. Then: "Check which of these use Claude"
+        3. Or combined: "Get my HubSpot companies and check which use Claude"
+    """
+    if not companies:
+        return {"error": "No companies provided", "hint": "Pass a comma-separated list of company names"}
+
+    # Parse comma-separated companies to list
+    company_list = [c.strip() for c in companies.split(",") if c.strip()]
+
+    return await _batch_check_companies_impl(company_list, include_evidence)
+
+
 @mcp.tool()
 async def check_companies_from_crm(
     companies: list[dict],
@@ -717,13 +1225,10 @@ async def check_companies_from_crm(
 
     for c in companies:
         # Try different field names that CRMs might use
-        name = (
-            c.get("name") or
-            c.get("company_name") or
-            c.get("company") or
-            c.get("domain", "").replace(".com", "").replace(".io", "").replace("www.", "") or
-            c.get("website", "").replace("https://", "").replace("http://", "").replace("www.", "").split(".")[0]
-        )
+        name = c.get("name") or c.get("company_name") or c.get("company")
+        if not name:
+            match = _DOMAIN_RE.match((c.get("domain") or c.get("website") or "").strip())
+            name = match.group(1) if match else None
 
         if name:
             name = name.strip()
@@ -738,7 +1243,7 @@ async def check_companies_from_crm(
         }
 
     # Use the batch checker
-    batch_results = await batch_check_companies(company_names[:50], include_evidence=False)
+    batch_results = await _batch_check_companies_impl(company_names[:50])
 
     if "error" in batch_results:
         return batch_results
@@ -784,103 +1289,60 @@ async def _does_company_use_claude_impl(company: str) -> dict:
     if not GITHUB_TOKEN:
         return {"error": "GITHUB_TOKEN required"}
 
-    # Normalize company name to likely GitHub org
-    org_name = company.lower().replace(" ", "").replace("-", "").replace(".", "")
-
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "Authorization": f"token {GITHUB_TOKEN}",
-    }
-
     signals = []
     evidence = []
+    confidence = "none"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Check if org exists
-        org_resp = await client.get(f"{GITHUB_API}/orgs/{org_name}", headers=headers)
-
-        org_info = None
-        if org_resp.status_code == 200:
-            org_data = org_resp.json()
-            org_info = {
-                "name": org_data.get("name") or org_name,
-                "github_org": org_name,
-                "description": org_data.get("description"),
-                "blog": org_data.get("blog"),
-                "public_repos": org_data.get("public_repos"),
-            }
-        else:
-            # Try common variations
-            variations = [company.lower(), company.replace(" ", "-").lower(), f"{company.lower()}hq", f"{company.lower()}-inc"]
-            for var in variations:
-                resp = await client.get(f"{GITHUB_API}/orgs/{var}", headers=headers)
-                if resp.status_code == 200:
-                    org_name = var
-                    org_data = resp.json()
-                    org_info = {
-                        "name": org_data.get("name") or var,
-                        "github_org": var,
-                        "description": org_data.get("description"),
-                        "blog": org_data.get("blog"),
-                        "public_repos": org_data.get("public_repos"),
-                    }
-                    break
-
-        if not org_info:
-            return {
-                "company": company,
-                "found_on_github": False,
-                "uses_claude": "unknown",
-                "note": f"Could not find GitHub org for '{company}'. Try the exact GitHub org name.",
-            }
+    # Find the org (name + common variations, cached across calls)
+    org = await _resolve_github_org(company)
+    if org is None:
+        return {
+            "company": company,
+            "found_on_github": False,
+            "uses_claude": "unknown",
+            "note": f"Could not find GitHub org for '{company}'. Try the exact GitHub org name.",
+        }
 
-        # Search for Claude signals
-        searches = [
-            (f"org:{org_name} filename:.mcp.json", "MCP config file", "very_high"),
-            (f"org:{org_name} claude-code-action path:.github", "Claude Code GitHub Action", "very_high"),
-            (f"org:{org_name} ANTHROPIC_API_KEY", "Anthropic API key reference", "high"),
-            (f'org:{org_name} "@anthropic-ai/sdk"', "Anthropic SDK usage", "high"),
-            (f'org:{org_name} "from anthropic import"', "Anthropic Python import", "high"),
-            (f'org:{org_name} "claude" "api"', "Claude API mention", "medium"),
-        ]
+    org_name, org_data = org
+    org_info = {
+        "name": org_data.get("name") or org_name,
+        "github_org": org_name,
+        "description": org_data.get("description"),
+        "blog": org_data.get("blog"),
+        "public_repos": org_data.get("public_repos"),
+    }
 
-        for query, description, confidence in searches:
-            try:
-                resp = await client.get(
-                    f"{GITHUB_API}/search/code",
-                    params={"q": query, "per_page": 5},
-                    headers=headers,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if data.get("total_count", 0) > 0:
-                        signals.append({
-                            "signal": description,
-                            "confidence": confidence,
-                            "matches": data["total_count"],
-                        })
-                        for item in data.get("items", [])[:2]:
-                            evidence.append({
-                                "repo": item.get("repository", {}).get("full_name"),
-                                "file": item.get("path"),
-                                "signal": description,
-                            })
-            except Exception:
+    # Search for Claude signals, very high checks first (see _DEEP_ORG_PHASES)
+    for phase in _DEEP_ORG_PHASES:
+        responses = await asyncio.gather(
+            *(_probe_org_signal(org_name, signal) for signal, _, _ in phase),
+            return_exceptions=True,
+        )
+
+        for (_, description, signal_confidence), resp in zip(phase, responses):
+            if isinstance(resp, Exception):
                 continue
+            status, data = resp
+            if status == 200 and data.get("total_count", 0) > 0:
+                signals.append({
+                    "signal": description,
+                    "confidence": signal_confidence,
+                    "matches": data["total_count"],
+                })
+                if CONF_ORDER[signal_confidence] > CONF_ORDER[confidence]:
+                    confidence = signal_confidence
+                for item in data.get("items", [])[:2]:
+                    evidence.append({
+                        "repo": item.get("repository", {}).get("full_name"),
+                        "file": item.get("path"),
+                        "signal": description,
+                    })
 
-    # Determine verdict
-    if any(s["confidence"] == "very_high" for s in signals):
-        verdict = "yes"
-        confidence = "very_high"
-    elif any(s["confidence"] == "high" for s in signals):
-        verdict = "likely"
-        confidence = "high"
-    elif signals:
-        verdict = "possibly"
-        confidence = "medium"
-    else:
-        verdict = "no evidence found"
-        confidence = "none"
+        if signals:
+            break
+
+    # Determine verdict from the strongest signal
+    verdict = CONFIDENCE_VERDICTS.get(confidence, "no evidence found")
 
     return {
         "company": org_info.get("name", company),
@@ -913,74 +1375,73 @@ async def does_company_use_claude(company: str) -> dict:
 
 async def _search_hackernews_signals_impl(company: str, days_back: int = 365) -> dict:
     """Internal implementation for HN search."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Search for company + Claude mentions
-        queries = [
-            f'"{company}" Claude',
-            f'"{company}" Anthropic',
-            f'"{company}" "Claude Code"',
-        ]
+    client = get_http_client()
 
-        all_results = []
-        seen_ids = set()
+    # Search for company + Claude mentions
+    queries = [
+        f'"{company}" Claude',
+        f'"{company}" Anthropic',
+        f'"{company}" "Claude Code"',
+    ]
 
-        for query in queries:
-            try:
-                # Search stories
-                stories_resp = await client.get(
-                    f"{HN_ALGOLIA_API}/search",
-                    params={
-                        "query": query,
-                        "tags": "story",
-                        "hitsPerPage": 20,
-                    },
-                )
-                if stories_resp.status_code == 200:
-                    for hit in stories_resp.json().get("hits", []):
-                        if hit["objectID"] not in seen_ids:
-                            seen_ids.add(hit["objectID"])
-                            all_results.append({
-                                "type": "story",
-                                "title": hit.get("title"),
-                                "url": f"https://news.ycombinator.com/item?id={hit['objectID']}",
-                                "author": hit.get("author"),
-                                "points": hit.get("points"),
-                                "comments": hit.get("num_comments"),
-                                "date": hit.get("created_at"),
-                            })
-
-                # Search comments
-                comments_resp = await client.get(
-                    f"{HN_ALGOLIA_API}/search",
-                    params={
-                        "query": query,
-                        "tags": "comment",
-                        "hitsPerPage": 30,
-                    },
-                )
-                if comments_resp.status_code == 200:
-                    for hit in comments_resp.json().get("hits", []):
-                        if hit["objectID"] not in seen_ids:
-                            seen_ids.add(hit["objectID"])
-                            comment_text = hit.get("comment_text", "")[:200]
-                            all_results.append({
-                                "type": "comment",
-                                "text_preview": comment_text,
-                                "url": f"https://news.ycombinator.com/item?id={hit['objectID']}",
-                                "author": hit.get("author"),
-                                "date": hit.get("created_at"),
-                            })
+    # Story and comment searches for every query, all in flight together
+    searches = [(query, tag) for query in queries for tag in ("story", "comment")]
+    responses = await asyncio.gather(
+        *(
+            client.get(
+                f"{HN_ALGOLIA_API}/search",
+                params={
+                    "query": query,
+                    "tags": tag,
+                    "hitsPerPage": 20 if tag == "story" else 30,
+                },
+            )
+            for query, tag in searches
+        ),
+        return_exceptions=True,
+    )
 
-            except Exception:
+    all_results = []
+    seen_ids = set()
+
+    for (_, tag), resp in zip(searches, responses):
+        if isinstance(resp, Exception) or resp.status_code != 200:
+            continue
+        try:
+            hits = orjson.loads(resp.content).get("hits", [])
+        except orjson.JSONDecodeError:
+            continue
+
+        for hit in hits:
+            object_id = hit["objectID"]
+            if object_id in seen_ids:
                 continue
+            seen_ids.add(object_id)
+            url = f"https://news.ycombinator.com/item?id={object_id}"
+
+            if tag == "story":
+                all_results.append({
+                    "type": "story",
+                    "title": hit.get("title"),
+                    "url": url,
+                    "author": hit.get("author"),
+                    "points": hit.get("points"),
+                    "comments": hit.get("num_comments"),
+                    "date": hit.get("created_at"),
+                })
+            else:
+                all_results.append({
+                    "type": "comment",
+                    "text_preview": (hit.get("comment_text") or "")[:200],
+                    "url": url,
+                    "author": hit.get("author"),
+                    "date": hit.get("created_at"),
+                })
 
     # Analyze results for relevance
     relevant_results = []
-    claude_terms = ["claude", "anthropic", "claude code", "mcp", "model context protocol"]
-
     for r in all_results:
-        text = f"{r.get('title', '')} {r.get('text_preview', '')}".lower()
-        if any(term in text for term in claude_terms):
+        if _HN_RELEVANCE_RE.search(f"{r.get('title', '')} {r.get('text_preview', '')}"):
             relevant_results.append(r)
 
     return {
@@ -1008,72 +1469,94 @@ async def search_hackernews_signals(company: str, days_back: int = 365) -> dict:
     return await _search_hackernews_signals_impl(company, days_back)
 
 
+# Cap on concurrent npm / PyPI registry requests from a single check
+_REGISTRY_SEMAPHORE = asyncio.Semaphore(20)
+
+
+async def _registry_get(url: str, params: dict | None = None) -> httpx.Response:
+    async with _REGISTRY_SEMAPHORE:
+        return await get_http_client().get(url, params=params)
+
+
+async def _npm_search_org(org: str) -> list[dict]:
+    """npm search hits for packages maintained by org, falling back to its scope."""
+    search_resp = await _registry_get(
+        f"{NPM_REGISTRY_API}/-/v1/search",
+        params={"text": f"maintainer:{org}", "size": 50},
+    )
+
+    if search_resp.status_code != 200:
+        # Try scope search
+        search_resp = await _registry_get(
+            f"{NPM_REGISTRY_API}/-/v1/search",
+            params={"text": f"scope:{org}", "size": 50},
+        )
+
+    if search_resp.status_code != 200:
+        return []
+    return orjson.loads(search_resp.content).get("objects", [])
+
+
+# npm package checks: name -> (expires_at, future), shared across tool calls
+_npm_package_cache: dict[str, tuple[float, asyncio.Future]] = {}
+
+
+async def _npm_anthropic_package(pkg_name: str) -> dict | None:
+    """Evidence dict if the latest version of pkg_name depends on an Anthropic package."""
+    pkg_resp = await _registry_get(f"{NPM_REGISTRY_API}/{pkg_name}/latest")
+    if pkg_resp.status_code != 200:
+        return None
+
+    pkg_data = orjson.loads(pkg_resp.content)
+    deps = pkg_data.get("dependencies") or {}
+    dev_deps = pkg_data.get("devDependencies") or {}
+
+    # Check for Anthropic SDK (most packages have none, so test before collecting)
+    if not any("anthropic" in d.lower() for d in chain(deps, dev_deps)):
+        return None
+    anthropic_deps = list(dict.fromkeys(
+        d for d in chain(deps, dev_deps) if "anthropic" in d.lower()
+    ))
+    return {
+        "package": pkg_name,
+        "version": pkg_data.get("version"),
+        "anthropic_dependencies": anthropic_deps,
+        "npm_url": f"https://www.npmjs.com/package/{pkg_name}",
+    }
+
+
 async def _check_npm_anthropic_usage_impl(company: str) -> dict:
     """Internal implementation for npm check."""
-    org_variations = [
+    org_variations = list(dict.fromkeys([
         company.lower(),
         company.lower().replace(" ", ""),
         company.lower().replace(" ", "-"),
-    ]
-
-    anthropic_packages = []
-    all_packages = []
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for org in org_variations:
-            try:
-                # Search for packages by org/maintainer
-                search_resp = await client.get(
-                    f"{NPM_REGISTRY_API}/-/v1/search",
-                    params={
-                        "text": f"maintainer:{org}",
-                        "size": 50,
-                    },
-                )
-
-                if search_resp.status_code != 200:
-                    # Try scope search
-                    search_resp = await client.get(
-                        f"{NPM_REGISTRY_API}/-/v1/search",
-                        params={
-                            "text": f"scope:{org}",
-                            "size": 50,
-                        },
-                    )
-
-                if search_resp.status_code == 200:
-                    packages = search_resp.json().get("objects", [])
-
-                    for pkg in packages:
-                        pkg_name = pkg.get("package", {}).get("name")
-                        if not pkg_name:
-                            continue
+    ]))
 
-                        all_packages.append(pkg_name)
-
-                        # Get package details to check dependencies
-                        try:
-                            pkg_resp = await client.get(f"{NPM_REGISTRY_API}/{pkg_name}/latest")
-                            if pkg_resp.status_code == 200:
-                                pkg_data = pkg_resp.json()
-                                deps = pkg_data.get("dependencies", {})
-                                dev_deps = pkg_data.get("devDependencies", {})
-                                all_deps = {**deps, **dev_deps}
-
-                                # Check for Anthropic SDK
-                                anthropic_deps = [d for d in all_deps if "anthropic" in d.lower()]
-                                if anthropic_deps:
-                                    anthropic_packages.append({
-                                        "package": pkg_name,
-                                        "version": pkg_data.get("version"),
-                                        "anthropic_dependencies": anthropic_deps,
-                                        "npm_url": f"https://www.npmjs.com/package/{pkg_name}",
-                                    })
-                        except Exception:
-                            continue
+    # Search every org variation at once, then fetch package details at once
+    searches = await asyncio.gather(
+        *(_npm_search_org(org) for org in org_variations),
+        return_exceptions=True,
+    )
 
-            except Exception:
-                continue
+    # Variations often return the same packages; check each one once, and
+    # reuse recent checks from earlier calls
+    all_packages = list(dict.fromkeys(
+        pkg_name
+        for packages in searches
+        if not isinstance(packages, Exception)
+        for pkg in packages
+        if (pkg_name := pkg.get("package", {}).get("name"))
+    ))
+
+    details = await asyncio.gather(
+        *(
+            _ttl_cached(_npm_package_cache, pkg_name, lambda n=pkg_name: _npm_anthropic_package(n))
+            for pkg_name in all_packages
+        ),
+        return_exceptions=True,
+    )
+    anthropic_packages = [d for d in details if d and not isinstance(d, Exception)]
 
     return {
         "company": company,
@@ -1101,66 +1584,59 @@ async def check_npm_anthropic_usage(company: str) -> dict:
     return await _check_npm_anthropic_usage_impl(company)
 
 
-async def _check_pypi_anthropic_usage_impl(company: str) -> dict:
-    """Internal implementation for PyPI check."""
-    # PyPI doesn't have a great search API, so we'll use the simple API
-    # and search via the JSON endpoint
-    anthropic_packages = []
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Search PyPI using simple search
-        # Note: PyPI's search is limited, so we check known patterns
-        search_terms = [
-            company.lower(),
-            company.lower().replace(" ", "-"),
-            company.lower().replace(" ", "_"),
-        ]
+async def _pypi_anthropic_package(term: str, pkg_name: str) -> dict | None:
+    """Evidence dict if pkg_name is authored by term and requires anthropic."""
+    pkg_resp = await _registry_get(f"{PYPI_API}/{pkg_name}/json")
+    if pkg_resp.status_code != 200:
+        return None
 
-        # Try to find packages by searching
-        for term in search_terms:
-            try:
-                # Use PyPI's simple search via Google (hacky but works)
-                # Or try the JSON API for known package patterns
-                possible_packages = [
-                    term,
-                    f"{term}-sdk",
-                    f"{term}-python",
-                    f"{term}-client",
-                    f"py{term}",
-                ]
-
-                for pkg_name in possible_packages:
-                    try:
-                        pkg_resp = await client.get(f"{PYPI_API}/{pkg_name}/json")
-                        if pkg_resp.status_code == 200:
-                            pkg_data = pkg_resp.json()
-                            info = pkg_data.get("info", {})
-
-                            # Check if package author matches company
-                            author = info.get("author", "").lower()
-                            maintainer = info.get("maintainer", "").lower()
-                            author_email = info.get("author_email", "").lower()
-
-                            if not (term in author or term in maintainer or term in author_email):
-                                continue
-
-                            # Check dependencies
-                            requires = info.get("requires_dist", []) or []
-                            requires_str = " ".join(requires).lower()
-
-                            if "anthropic" in requires_str:
-                                anthropic_packages.append({
-                                    "package": info.get("name"),
-                                    "version": info.get("version"),
-                                    "author": info.get("author"),
-                                    "pypi_url": info.get("project_url") or f"https://pypi.org/project/{pkg_name}/",
-                                    "requires_anthropic": True,
-                                })
-                    except Exception:
-                        continue
+    info = orjson.loads(pkg_resp.content).get("info", {})
 
-            except Exception:
-                continue
+    # Check if package author matches company (newline-joined so a term
+    # can't match across two fields)
+    people = "\n".join(
+        filter(None, (info.get("author"), info.get("maintainer"), info.get("author_email")))
+    ).lower()
+
+    if term not in people:
+        return None
+
+    # Check dependencies
+    requires = info.get("requires_dist", []) or []
+    requires_str = " ".join(requires).lower()
+
+    if "anthropic" not in requires_str:
+        return None
+    return {
+        "package": info.get("name"),
+        "version": info.get("version"),
+        "author": info.get("author"),
+        "pypi_url": info.get("project_url") or f"https://pypi.org/project/{pkg_name}/",
+        "requires_anthropic": True,
+    }
+
+
+async def _check_pypi_anthropic_usage_impl(company: str) -> dict:
+    """Internal implementation for PyPI check."""
+    # PyPI doesn't have a great search API, so we probe the JSON endpoint
+    # for common package name patterns built from the company name
+    search_terms = dict.fromkeys([
+        company.lower(),
+        company.lower().replace(" ", "-"),
+        company.lower().replace(" ", "_"),
+    ])
+
+    # (term, package) candidates, first term wins when names collide
+    candidates = {}
+    for term in search_terms:
+        for pkg_name in (term, f"{term}-sdk", f"{term}-python", f"{term}-client", f"py{term}"):
+            candidates.setdefault(pkg_name, term)
+
+    results = await asyncio.gather(
+        *(_pypi_anthropic_package(term, pkg_name) for pkg_name, term in candidates.items()),
+        return_exceptions=True,
+    )
+    anthropic_packages = [r for r in results if r and not isinstance(r, Exception)]
 
     return {
         "company": company,
@@ -1189,7 +1665,54 @@ async def check_pypi_anthropic_usage(company: str) -> dict:
 
 # ============ LINKEDIN TOOLS (Voyager API) ============
 
-async def _search_linkedin_posts_impl(company: str, keywords: str | None = None) -> dict:
+# Fixed Voyager parameters (endpoints and decorations from the linkedin-api library)
+_LI_JOB_SEARCH_PARAMS = MappingProxyType({
+    "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
+    "count": 25,
+    "q": "jobSearch",
+    "start": 0,
+})
+_LI_COMPANY_SEARCH_PARAMS = MappingProxyType({
+    "decorationId": "com.linkedin.voyager.dash.deco.search.SearchClusterCollection-175",
+    "origin": "GLOBAL_SEARCH_HEADER",
+    "q": "all",
+    "start": 0,
+    "count": 5,
+})
+# Include " in safe chars to preserve exact phrase quotes in keywords
+_LI_URL_SAFE = '(),:"\''
+
+
+def _li_text(node, default: str = "") -> str:
+    """Return the text of a LinkedIn {"text": ...} view model, or default if absent."""
+    if isinstance(node, dict):
+        return node.get("text") or default
+    return default
+
+
+def _first_keyword_in(text: str, keywords: list[str]) -> str | None:
+    """First keyword (quotes ignored) that appears in text, case-insensitively."""
+    text = text.lower()
+    for kw in keywords:
+        if kw.strip('"').lower() in text:
+            return kw
+    return None
+
+
+def _linkedin_or_query(prefix: str | None, keywords: list[str]) -> str:
+    """
+    OR-join keyword searches into one LinkedIn query. Implicit AND binds tighter
+    than OR, so "acme Claude OR acme Anthropic" needs no parentheses (which would
+    clash with the Rest.li syntax the query is embedded in).
+    """
+    return " OR ".join(f"{prefix} {kw}" if prefix else kw for kw in keywords)
+
+
+async def _search_linkedin_posts_impl(
+    company: str,
+    keywords: str | None = None,
+    per_keyword: bool = False,
+) -> dict:
     """Internal implementation for LinkedIn posts search."""
     if not LINKEDIN_COOKIE:
         return {
@@ -1215,96 +1738,100 @@ async def _search_linkedin_posts_impl(company: str, keywords: str | None = None)
         search_keywords = [k.strip() for k in keywords.split(",") if k.strip()]
     else:
         search_keywords = ["Claude", "Anthropic", "Claude Code"]
-    all_posts = []
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for keyword in search_keywords:
-            query = f"{company} {keyword}"
+    # Posts are deduplicated on collection by the first 100 chars of their text
+    unique_posts = []
+    seen = set()
+
+    client = get_http_client()
+
+    # One OR-joined search covers every keyword unless per-keyword searches are asked for
+    if per_keyword:
+        searches = [(keyword, f"{company} {keyword}") for keyword in search_keywords]
+    else:
+        searches = [(None, _linkedin_or_query(company, search_keywords))]
+
+    def tag_post(post: dict, keyword: str | None) -> dict:
+        # OR-joined hits are attributed to the first keyword found in the post text
+        keyword = keyword or _first_keyword_in(post["text"], search_keywords)
+        post["query"] = f"{company} {keyword}" if keyword else post["query"]
+        post["keyword_matched"] = keyword
+        return post
+
+    for keyword, query in searches:
+        try:
+            # Use LinkedIn's GraphQL search endpoint (from linkedin-api library)
+            graphql_url = (
+                f"{LINKEDIN_API}/graphql?variables=(start:0,origin:GLOBAL_SEARCH_HEADER,"
+                f"query:(keywords:{query},flagshipSearchIntent:SEARCH_SRP,"
+                f"queryParameters:List((key:resultType,value:List(CONTENT)))))"
+                f"&queryId=voyagerSearchDashClusters.b0928897b71bd00a5a7291755dcd64f0"
+            )
+            resp = await client.get(graphql_url, headers=headers)
+
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
+
+                # Parse the GraphQL response
+                data_clusters = data.get("data", {}).get("searchDashClustersByAll", {})
+                for cluster in data_clusters.get("elements", []):
+                    for item in cluster.get("items", []):
+                        entity = item.get("item", {}).get("entityResult", {})
+                        if entity:
+                            # Extract post text from title or summary
+                            text = _li_text(entity.get("title")) or _li_text(entity.get("summary"))
+
+                            post = {
+                                "type": "post",
+                                "query": query,
+                                "text": text[:500],
+                                "author": _li_text(entity.get("primarySubtitle"), "Unknown"),
+                                "url": entity.get("navigationUrl", ""),
+                            }
+
+                            key = post["text"][:100]
+                            if key and key not in seen:
+                                seen.add(key)
+                                unique_posts.append(tag_post(post, keyword))
+
+            elif resp.status_code == 401:
+                return {
+                    "error": "LinkedIn cookie expired or invalid",
+                    "setup": "Refresh your li_at cookie from Chrome DevTools",
+                }
 
+        except Exception as e:
+            # Try alternative search endpoint as fallback
             try:
-                # Use LinkedIn's GraphQL search endpoint (from linkedin-api library)
-                graphql_url = (
-                    f"{LINKEDIN_API}/graphql?variables=(start:0,origin:GLOBAL_SEARCH_HEADER,"
-                    f"query:(keywords:{query},flagshipSearchIntent:SEARCH_SRP,"
-                    f"queryParameters:List((key:resultType,value:List(CONTENT)))))"
-                    f"&queryId=voyagerSearchDashClusters.b0928897b71bd00a5a7291755dcd64f0"
+                resp = await client.get(
+                    f"{LINKEDIN_API}/search/blended",
+                    params={
+                        "keywords": query,
+                        "origin": "GLOBAL_SEARCH_HEADER",
+                        "q": "all",
+                        "filters": "List(resultType->CONTENT)",
+                        "count": 20,
+                    },
+                    headers=headers,
                 )
-                resp = await client.get(graphql_url, headers=headers)
 
                 if resp.status_code == 200:
-                    data = resp.json()
-
-                    # Parse the GraphQL response
-                    data_clusters = data.get("data", {}).get("searchDashClustersByAll", {})
-                    for cluster in data_clusters.get("elements", []):
-                        for item in cluster.get("items", []):
-                            entity = item.get("item", {}).get("entityResult", {})
-                            if entity:
-                                # Extract post text from title or summary
-                                title = entity.get("title", {})
-                                text = ""
-                                if isinstance(title, dict):
-                                    text = title.get("text", "")
-                                summary = entity.get("summary", {})
-                                if isinstance(summary, dict) and not text:
-                                    text = summary.get("text", "")
-
-                                post = {
+                    data = orjson.loads(resp.content)
+                    for element in data.get("included", data.get("elements", [])):
+                        if element.get("$type", "").endswith("UpdateV2") or "commentary" in element:
+                            text = _li_text((element.get("commentary") or {}).get("text"))
+                            key = text[:100]
+                            if key and key not in seen:
+                                seen.add(key)
+                                unique_posts.append(tag_post({
                                     "type": "post",
                                     "query": query,
-                                    "text": text[:500] if text else "",
-                                    "author": entity.get("primarySubtitle", {}).get("text", "Unknown") if isinstance(entity.get("primarySubtitle"), dict) else "Unknown",
-                                    "url": entity.get("navigationUrl", ""),
-                                }
-
-                                if post["text"] and post not in all_posts:
-                                    all_posts.append(post)
-
-                elif resp.status_code == 401:
-                    return {
-                        "error": "LinkedIn cookie expired or invalid",
-                        "setup": "Refresh your li_at cookie from Chrome DevTools",
-                    }
-
-            except Exception as e:
-                # Try alternative search endpoint as fallback
-                try:
-                    resp = await client.get(
-                        f"{LINKEDIN_API}/search/blended",
-                        params={
-                            "keywords": query,
-                            "origin": "GLOBAL_SEARCH_HEADER",
-                            "q": "all",
-                            "filters": "List(resultType->CONTENT)",
-                            "count": 20,
-                        },
-                        headers=headers,
-                    )
-
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        for element in data.get("included", data.get("elements", [])):
-                            if element.get("$type", "").endswith("UpdateV2") or "commentary" in element:
-                                text = element.get("commentary", {}).get("text", {}).get("text", "")
-                                if text:
-                                    all_posts.append({
-                                        "type": "post",
-                                        "query": query,
-                                        "text": text[:500],
-                                        "author": element.get("actor", {}).get("name", {}).get("text", "Unknown"),
-                                        "url": f"https://www.linkedin.com/feed/update/{element.get('urn', '')}",
-                                    })
-                except Exception:
-                    continue
-
-    # Deduplicate
-    seen = set()
-    unique_posts = []
-    for post in all_posts:
-        key = post.get("text", "")[:100]
-        if key and key not in seen:
-            seen.add(key)
-            unique_posts.append(post)
+                                    "text": text[:500],
+                                    "author": _li_text((element.get("actor") or {}).get("name"), "Unknown"),
+                                    "url": f"https://www.linkedin.com/feed/update/{element.get('urn', '')}",
+                                }, keyword))
+            except Exception:
+                continue
 
     return {
         "company": company,
@@ -1316,7 +1843,11 @@ async def _search_linkedin_posts_impl(company: str, keywords: str | None = None)
 
 
 @mcp.tool()
-async def search_linkedin_posts(company: str, keywords: str | None = None) -> dict:
+async def search_linkedin_posts(
+    company: str,
+    keywords: str | None = None,
+    per_keyword: bool = False,
+) -> dict:
     """
     Search LinkedIn for posts mentioning a company and Claude/Anthropic.
     Uses LinkedIn's Voyager API directly (no Selenium needed).
@@ -1326,11 +1857,14 @@ async def search_linkedin_posts(company: str, keywords: str | None = None) -> di
         company: Company name to search for
         keywords: Comma-separated keywords (default: "Claude, Anthropic, Claude Code")
                   Example: "Claude Code, MCP, Anthropic SDK"
+        per_keyword: Run one search per keyword instead of a single OR-joined search
+                     (slower; otherwise each post is tagged with the first keyword
+                     found in its text)
 
     Returns:
         LinkedIn posts mentioning the company and Claude/Anthropic
     """
-    return await _search_linkedin_posts_impl(company, keywords)
+    return await _search_linkedin_posts_impl(company, keywords, per_keyword)
 
 
 async def _search_linkedin_jobs_impl(
@@ -1338,6 +1872,7 @@ async def _search_linkedin_jobs_impl(
     keywords: str | None = None,
     location: str | None = None,
     days_back: int = 7,
+    per_keyword: bool = False,
 ) -> dict:
     """Internal implementation for LinkedIn jobs search."""
     if not LINKEDIN_COOKIE:
@@ -1370,7 +1905,9 @@ async def _search_linkedin_jobs_impl(
         f'"{kw}"' if " " in kw and not kw.startswith('"') else kw
         for kw in search_keywords
     ]
-    all_jobs = []
+    # Jobs are deduplicated on collection by (title, company)
+    unique_jobs = []
+    seen = set()
     search_debug_info = []  # Track what searches were performed
 
     # Convert days_back to LinkedIn's time filter format
@@ -1382,132 +1919,111 @@ async def _search_linkedin_jobs_impl(
     else:
         time_filter = "r2592000"  # 30 days (max)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for keyword in search_keywords:
-            query = f'{company} {keyword}' if company else keyword
+    client = get_http_client()
 
-            try:
-                # Build query string in LinkedIn's format
-                # Note: LinkedIn expects the keywords value to preserve quotes for exact matching
-                query_parts = [
-                    f"origin:JOB_SEARCH_PAGE_QUERY_EXPANSION",
-                    f"keywords:{query}",
-                    f"selectedFilters:(timePostedRange:List({time_filter}))",
-                    "spellCorrectionEnabled:true",
-                ]
-                if location:
-                    query_parts.append(f"locationFallback:{location}")
-
-                query_string = "(" + ",".join(query_parts) + ")"
-
-                # Use the correct endpoint from linkedin-api library
-                params = {
-                    "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
-                    "count": 25,
-                    "q": "jobSearch",
-                    "query": query_string,
-                    "start": 0,
-                }
+    # One OR-joined search covers every keyword unless per-keyword searches are asked for
+    if per_keyword:
+        searches = [
+            (keyword, f"{company} {keyword}" if company else keyword)
+            for keyword in search_keywords
+        ]
+    else:
+        searches = [(None, _linkedin_or_query(company, search_keywords))]
 
-                from urllib.parse import urlencode
-                # Include " in safe chars to preserve exact phrase quotes in keywords
-                safe_chars = '(),:"\''
-                url = f"{LINKEDIN_API}/voyagerJobsDashJobCards?{urlencode(params, safe=safe_chars)}"
+    # Everything in the job search query except the keywords is fixed per call
+    # Note: LinkedIn expects the keywords value to preserve quotes for exact matching
+    query_suffix = (
+        f",selectedFilters:(timePostedRange:List({time_filter})),spellCorrectionEnabled:true"
+    )
+    if location:
+        query_suffix += f",locationFallback:{location}"
+    job_headers = headers | {"accept": "application/vnd.linkedin.normalized+json+2.1"}
 
-                resp = await client.get(
-                    url,
-                    headers={**headers, "accept": "application/vnd.linkedin.normalized+json+2.1"},
-                )
+    for keyword, query in searches:
+        try:
+            # Build query string in LinkedIn's format
+            params = _LI_JOB_SEARCH_PARAMS | {
+                "query": f"(origin:JOB_SEARCH_PAGE_QUERY_EXPANSION,keywords:{query}{query_suffix})",
+            }
+            url = f"{LINKEDIN_API}/voyagerJobsDashJobCards?{urlencode(params, safe=_LI_URL_SAFE)}"
 
-                # Debug: track what we searched and got
-                search_debug = {
-                    "keyword": keyword,
-                    "query": query,
-                    "status_code": resp.status_code,
-                    "result_count": 0,
-                }
+            resp = await client.get(url, headers=job_headers)
 
-                if resp.status_code == 200:
-                    data = resp.json()
-
-                    # Build lookup for referenced objects
-                    urn_lookup = {}
-                    for el in data.get("included", []):
-                        if el.get("entityUrn"):
-                            urn_lookup[el["entityUrn"]] = el
-
-                    # Use JobPostingCard which has full display info
-                    for element in data.get("included", []):
-                        if element.get("$type") == "com.linkedin.voyager.dash.jobs.JobPostingCard":
-                            # Skip cards without full data (only have entityUrn)
-                            if not element.get("primaryDescription"):
-                                continue
-
-                            # Extract title - can be dict with text property or string
-                            title_field = element.get("title", {})
-                            if isinstance(title_field, dict):
-                                title = title_field.get("text", "")
-                            else:
-                                title = str(title_field) if title_field else ""
-
-                            # If no title in card, try referenced job posting
-                            if not title:
-                                job_ref = element.get("*jobPosting")
-                                if job_ref and job_ref in urn_lookup:
-                                    title = urn_lookup[job_ref].get("title", "")
-
-                            # Get company from primaryDescription
-                            company_name = ""
-                            primary_desc = element.get("primaryDescription", {})
-                            if isinstance(primary_desc, dict):
-                                company_name = primary_desc.get("text", "")
-
-                            # Get location from secondaryDescription
-                            loc = ""
-                            secondary_desc = element.get("secondaryDescription", {})
-                            if isinstance(secondary_desc, dict):
-                                loc = secondary_desc.get("text", "")
-
-                            # Build job URL from URN
-                            job_urn = element.get("jobPostingUrn", element.get("*jobPosting", ""))
-                            job_id = job_urn.split(":")[-1] if job_urn else ""
-
-                            job = {
-                                "title": title,
-                                "company": company_name,
-                                "location": loc,
-                                "url": f"https://www.linkedin.com/jobs/view/{job_id}" if job_id else "",
-                                "keyword_matched": keyword,
-                            }
-                            if job["title"]:
-                                all_jobs.append(job)
-                                search_debug["result_count"] += 1
+            # Debug: track what we searched and got
+            search_debug = {
+                "keyword": keyword or query,
+                "query": query,
+                "status_code": resp.status_code,
+                "result_count": 0,
+            }
 
-                search_debug_info.append(search_debug)
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
 
-            except Exception as e:
-                search_debug_info.append({
-                    "keyword": keyword,
-                    "query": query,
-                    "error": str(e),
-                })
-                continue
+                # Build lookup for referenced objects
+                urn_lookup = {}
+                for el in data.get("included", []):
+                    if el.get("entityUrn"):
+                        urn_lookup[el["entityUrn"]] = el
 
-    # Deduplicate by title + company
-    seen = set()
-    unique_jobs = []
-    for job in all_jobs:
-        key = f"{job.get('title', '')}-{job.get('company', '')}"
-        if key not in seen:
-            seen.add(key)
-            unique_jobs.append(job)
+                # Use JobPostingCard which has full display info
+                for element in data.get("included", []):
+                    if element.get("$type") == "com.linkedin.voyager.dash.jobs.JobPostingCard":
+                        # Skip cards without full data (only have entityUrn)
+                        primary_desc = element.get("primaryDescription")
+                        if not primary_desc:
+                            continue
+
+                        # Extract title - can be dict with text property or string
+                        title_field = element.get("title")
+                        if isinstance(title_field, dict):
+                            title = _li_text(title_field)
+                        else:
+                            title = str(title_field) if title_field else ""
+
+                        # If no title in card, try referenced job posting
+                        if not title:
+                            job_ref = element.get("*jobPosting")
+                            if job_ref and job_ref in urn_lookup:
+                                title = urn_lookup[job_ref].get("title", "")
+
+                        # Company from primaryDescription, location from secondaryDescription
+                        company_name = _li_text(primary_desc)
+                        loc = _li_text(element.get("secondaryDescription"))
+
+                        # Build job URL from URN
+                        job_urn = element.get("jobPostingUrn") or element.get("*jobPosting") or ""
+                        job_id = job_urn.rpartition(":")[2]
+
+                        job = {
+                            "title": title,
+                            "company": company_name,
+                            "location": loc,
+                            "url": f"https://www.linkedin.com/jobs/view/{job_id}" if job_id else "",
+                            "keyword_matched": keyword or _first_keyword_in(title, search_keywords),
+                        }
+                        if job["title"]:
+                            search_debug["result_count"] += 1
+                            key = (title, company_name)
+                            if key not in seen:
+                                seen.add(key)
+                                unique_jobs.append(job)
+
+            search_debug_info.append(search_debug)
+
+        except Exception as e:
+            search_debug_info.append({
+                "keyword": keyword or query,
+                "query": query,
+                "error": str(e),
+            })
+            continue
 
     # Filter to only jobs that actually mention Claude/Anthropic in title
     claude_jobs = []
     other_jobs = []
     for job in unique_jobs:
-        title_lower = job.get("title", "").lower()
-        if any(kw.lower() in title_lower for kw in ["claude", "anthropic", "llm", "ai", "ml"]):
+        if _AI_TITLE_RE.search(job.get("title", "")):
             claude_jobs.append(job)
         else:
             other_jobs.append(job)
@@ -1533,6 +2049,7 @@ async def search_linkedin_jobs(
     keywords: str | None = None,
     location: str | None = None,
     days_back: int = 7,
+    per_keyword: bool = False,
 ) -> dict:
     """
     Search LinkedIn for job postings mentioning Claude/Anthropic.
@@ -1548,11 +2065,13 @@ async def search_linkedin_jobs(
                   Example: "Claude Code, MCP server, Anthropic SDK"
         location: Location filter (optional, e.g., "San Francisco")
         days_back: How far back to search (1=24h, 7=week, 30=month). Default: 7
+        per_keyword: Run one search per keyword instead of a single OR-joined search
+                     (slower, but keyword_matched is exact rather than read off the title)
 
     Returns:
         Job postings mentioning Claude/Anthropic with company names
     """
-    return await _search_linkedin_jobs_impl(company, keywords, location, days_back)
+    return await _search_linkedin_jobs_impl(company, keywords, location, days_back, per_keyword)
 
 
 @mcp.tool()
@@ -1671,86 +2190,88 @@ async def get_linkedin_company(company: str) -> dict:
         company_slug = company.split("/company/")[-1].strip("/").split("/")[0]
     else:
         # Normalize company name to likely LinkedIn slug
-        company_slug = company.lower().replace(" ", "-").replace(".", "").replace(",", "")
-
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        try:
-            # Try to get company by universal name (slug)
-            resp = await client.get(
-                f"{LINKEDIN_API}/organization/companies",
-                params={
-                    "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-40",
-                    "q": "universalName",
-                    "universalName": company_slug,
-                },
-                headers=headers,
-            )
+        company_slug = company.lower().translate(_LINKEDIN_SLUG_TABLE)
+
+    client = get_http_client()
+
+    try:
+        # Try to get company by universal name (slug)
+        resp = await client.get(
+            f"{LINKEDIN_API}/organization/companies",
+            params={
+                "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-40",
+                "q": "universalName",
+                "universalName": company_slug,
+            },
+            headers=headers,
+            follow_redirects=True,
+        )
 
-            if resp.status_code == 200:
-                data = resp.json()
-                elements = data.get("elements", [])
+        if resp.status_code == 200:
+            data = orjson.loads(resp.content)
+            elements = data.get("elements", [])
+
+            if elements:
+                company_data = elements[0]
+                industries = company_data.get("companyIndustries")
+
+                return {
+                    "company": company,
+                    "source": "linkedin",
+                    "found": True,
+                    "profile": {
+                        "name": company_data.get("name", ""),
+                        "universal_name": company_data.get("universalName", ""),
+                        "tagline": company_data.get("tagline", ""),
+                        "description": company_data.get("description", "")[:500],
+                        "website": company_data.get("companyPageUrl", company_data.get("websiteUrl", "")),
+                        "industry": industries[0].get("localizedName", "") if industries else "",
+                        "company_size": company_data.get("staffCountRange", {}).get("start", 0),
+                        "headquarters": company_data.get("headquarter", {}).get("city", ""),
+                        "founded": company_data.get("foundedOn", {}).get("year", ""),
+                        "specialties": company_data.get("specialities", []),
+                        "linkedin_url": f"https://www.linkedin.com/company/{company_slug}",
+                        "follower_count": company_data.get("followingInfo", {}).get("followerCount", 0),
+                    },
+                }
 
-                if elements:
-                    company_data = elements[0]
+        # Try search if direct lookup failed
+        resp = await client.get(
+            f"{LINKEDIN_API}/search/dash/clusters",
+            params=_LI_COMPANY_SEARCH_PARAMS | {
+                "query": f"(keywords:{company},resultType:List(COMPANIES))",
+            },
+            headers=headers,
+            follow_redirects=True,
+        )
 
+        if resp.status_code == 200:
+            data = orjson.loads(resp.content)
+            for element in data.get("included", []):
+                # "...MiniCompany" also ends with "Company"
+                if element.get("$type", "").endswith("Company"):
+                    universal_name = element.get("universalName", "")
+                    industry = element.get("industry")
                     return {
                         "company": company,
                         "source": "linkedin",
                         "found": True,
                         "profile": {
-                            "name": company_data.get("name", ""),
-                            "universal_name": company_data.get("universalName", ""),
-                            "tagline": company_data.get("tagline", ""),
-                            "description": company_data.get("description", "")[:500],
-                            "website": company_data.get("companyPageUrl", company_data.get("websiteUrl", "")),
-                            "industry": company_data.get("companyIndustries", [{}])[0].get("localizedName", "") if company_data.get("companyIndustries") else "",
-                            "company_size": company_data.get("staffCountRange", {}).get("start", 0),
-                            "headquarters": company_data.get("headquarter", {}).get("city", ""),
-                            "founded": company_data.get("foundedOn", {}).get("year", ""),
-                            "specialties": company_data.get("specialities", []),
-                            "linkedin_url": f"https://www.linkedin.com/company/{company_slug}",
-                            "follower_count": company_data.get("followingInfo", {}).get("followerCount", 0),
+                            "name": element.get("name", ""),
+                            "universal_name": universal_name,
+                            "description": (element.get("description") or "")[:500],
+                            "industry": industry.get("name", "") if isinstance(industry, dict) else "",
+                            "linkedin_url": f"https://www.linkedin.com/company/{universal_name}",
                         },
                     }
 
-            # Try search if direct lookup failed
-            resp = await client.get(
-                f"{LINKEDIN_API}/search/dash/clusters",
-                params={
-                    "decorationId": "com.linkedin.voyager.dash.deco.search.SearchClusterCollection-175",
-                    "origin": "GLOBAL_SEARCH_HEADER",
-                    "q": "all",
-                    "query": f"(keywords:{company},resultType:List(COMPANIES))",
-                    "start": 0,
-                    "count": 5,
-                },
-                headers=headers,
-            )
-
-            if resp.status_code == 200:
-                data = resp.json()
-                for element in data.get("included", []):
-                    if element.get("$type", "").endswith("Company") or element.get("$type", "").endswith("MiniCompany"):
-                        return {
-                            "company": company,
-                            "source": "linkedin",
-                            "found": True,
-                            "profile": {
-                                "name": element.get("name", ""),
-                                "universal_name": element.get("universalName", ""),
-                                "description": element.get("description", "")[:500] if element.get("description") else "",
-                                "industry": element.get("industry", {}).get("name", "") if isinstance(element.get("industry"), dict) else "",
-                                "linkedin_url": f"https://www.linkedin.com/company/{element.get('universalName', '')}",
-                            },
-                        }
-
-        except Exception as e:
-            return {
-                "company": company,
-                "source": "linkedin",
-                "found": False,
-                "error": str(e),
-            }
+    except Exception as e:
+        return {
+            "company": company,
+            "source": "linkedin",
+            "found": False,
+            "error": str(e),
+        }
 
     return {
         "company": company,
@@ -1760,6 +2281,20 @@ async def get_linkedin_company(company: str) -> dict:
     }
 
 
+# Brave's free plan allows one query per second
+_brave_limiter = AsyncLimiter(1, 1)
+
+
+async def _brave_search(client: httpx.AsyncClient, query: str) -> httpx.Response:
+    """Run one Brave web search within the plan's rate limit."""
+    async with _brave_limiter:
+        return await client.get(
+            f"{BRAVE_SEARCH_API}/web/search",
+            params={"q": query, "count": 10},
+            headers=BRAVE_HEADERS,
+        )
+
+
 async def _search_web_signals_impl(company: str, signal_type: str = "all") -> dict:
     """Internal implementation for web signals search."""
     if not BRAVE_API_KEY:
@@ -1770,58 +2305,57 @@ async def _search_web_signals_impl(company: str, signal_type: str = "all") -> di
             "results": [],
         }
 
-    headers = {
-        "X-Subscription-Token": BRAVE_API_KEY,
-        "Accept": "application/json",
-    }
-
     results = {
         "linkedin": [],
         "news": [],
         "blogs": [],
     }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        queries = []
+    client = get_http_client()
 
-        if signal_type in ("all", "linkedin"):
-            queries.append({
-                "type": "linkedin",
-                "query": f'site:linkedin.com "{company}" ("Claude Code" OR "using Claude" OR "Anthropic")',
-            })
+    queries = []
 
-        if signal_type in ("all", "news"):
-            queries.append({
-                "type": "news",
-                "query": f'"{company}" ("Claude AI" OR "Anthropic") (adoption OR using OR partnership OR announcement)',
-            })
+    if signal_type in ("all", "linkedin"):
+        queries.append({
+            "type": "linkedin",
+            "query": f'site:linkedin.com "{company}" ("Claude Code" OR "using Claude" OR "Anthropic")',
+        })
 
-        if signal_type in ("all", "blogs"):
-            queries.append({
-                "type": "blogs",
-                "query": f'"{company}" engineering blog ("Claude" OR "Anthropic") (implementation OR integration)',
-            })
+    if signal_type in ("all", "news"):
+        queries.append({
+            "type": "news",
+            "query": f'"{company}" ("Claude AI" OR "Anthropic") (adoption OR using OR partnership OR announcement)',
+        })
 
-        for q in queries:
-            try:
-                resp = await client.get(
-                    f"{BRAVE_SEARCH_API}/web/search",
-                    params={"q": q["query"], "count": 10},
-                    headers=headers,
-                )
+    if signal_type in ("all", "blogs"):
+        queries.append({
+            "type": "blogs",
+            "query": f'"{company}" engineering blog ("Claude" OR "Anthropic") (implementation OR integration)',
+        })
 
-                if resp.status_code == 200:
-                    data = resp.json()
-                    for result in data.get("web", {}).get("results", []):
-                        results[q["type"]].append({
-                            "title": result.get("title"),
-                            "url": result.get("url"),
-                            "description": result.get("description", "")[:200],
-                            "age": result.get("age"),
-                        })
+    # All queries go out together; the limiter spaces their starts to the plan's rate
+    responses = await asyncio.gather(
+        *(_brave_search(client, q["query"]) for q in queries),
+        return_exceptions=True,
+    )
 
-            except Exception as e:
-                results[q["type"]].append({"error": str(e)})
+    for q, resp in zip(queries, responses):
+        try:
+            if isinstance(resp, Exception):
+                raise resp
+
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
+                for result in data.get("web", {}).get("results", []):
+                    results[q["type"]].append({
+                        "title": result.get("title"),
+                        "url": result.get("url"),
+                        "description": result.get("description", "")[:200],
+                        "age": result.get("age"),
+                    })
+
+        except Exception as e:
+            results[q["type"]].append({"error": str(e)})
 
     # Calculate signal strength
     total_results = sum(len(v) for v in results.values() if isinstance(v, list))
@@ -1865,11 +2399,107 @@ async def search_web_signals(company: str, signal_type: str = "all") -> dict:
     return await _search_web_signals_impl(company, signal_type)
 
 
+async def _cached_scan(source: str, company: str, impl) -> dict:
+    """Run impl(company) for one full_multi_source_scan source, reusing recent results."""
+    return await _ttl_cached(
+        _scan_cache,
+        f"{source}:{company.lower().strip()}",
+        lambda: impl(company),
+        ttl=SCAN_CACHE_TTL,
+    )
+
+
+def _multi_source_signals(source: str, result: dict, use_linkedin: bool) -> list[dict]:
+    """Turn one full_multi_source_scan source result into weighted signals."""
+    if source == "github":
+        if result.get("uses_claude") == "yes":
+            return [{"source": "github", "signal": "MCP config found",
+                     "weight": SIGNAL_WEIGHTS["github_mcp_config"]}]
+        if result.get("uses_claude") == "likely":
+            return [{"source": "github", "signal": "Anthropic SDK usage",
+                     "weight": SIGNAL_WEIGHTS["github_anthropic_sdk"]}]
+        return []
+
+    if source == "hackernews":
+        if result.get("total_mentions", 0) > 0:
+            return [{
+                "source": "hackernews",
+                "signal": f"{result['total_mentions']} HN mentions",
+                "weight": SIGNAL_WEIGHTS["hackernews_mention"],
+            }]
+        return []
+
+    if source == "npm":
+        if result.get("packages_using_anthropic", 0) > 0:
+            return [{
+                "source": "npm",
+                "signal": f"{result['packages_using_anthropic']} packages use Anthropic SDK",
+                "weight": SIGNAL_WEIGHTS["npm_anthropic_dep"],
+            }]
+        return []
+
+    if source == "pypi":
+        if result.get("packages_using_anthropic", 0) > 0:
+            return [{
+                "source": "pypi",
+                "signal": f"{result['packages_using_anthropic']} packages use anthropic",
+                "weight": SIGNAL_WEIGHTS["pypi_anthropic_dep"],
+            }]
+        return []
+
+    if source == "linkedin_posts":
+        if result.get("total_posts", 0) > 0:
+            return [{
+                "source": "linkedin_posts",
+                "signal": f"{result['total_posts']} LinkedIn posts about Claude",
+                "weight": SIGNAL_WEIGHTS["linkedin_post"],
+            }]
+        return []
+
+    if source == "linkedin_jobs":
+        if result.get("claude_related_jobs", 0) > 0:
+            return [{
+                "source": "linkedin_jobs",
+                "signal": f"{result['claude_related_jobs']} LinkedIn job postings mention Claude/AI",
+                "weight": SIGNAL_WEIGHTS["linkedin_job"],
+            }]
+        return []
+
+    # Web search (additional LinkedIn via Brave, News, Blogs)
+    counts = result.get("counts") or {}
+    signals = []
+
+    # Only add Brave LinkedIn if we didn't already get direct LinkedIn results
+    if not use_linkedin and counts.get("linkedin_posts", 0) > 0:
+        signals.append({
+            "source": "linkedin_web",
+            "signal": f"{counts['linkedin_posts']} LinkedIn posts (via web search)",
+            "weight": SIGNAL_WEIGHTS["linkedin_post"],
+        })
+
+    if counts.get("blog_posts", 0) > 0:
+        signals.append({
+            "source": "engineering_blog",
+            "signal": f"{counts['blog_posts']} blog posts",
+            "weight": SIGNAL_WEIGHTS["engineering_blog"],
+        })
+
+    if counts.get("news_articles", 0) > 0:
+        signals.append({
+            "source": "news",
+            "signal": f"{counts['news_articles']} news articles",
+            "weight": SIGNAL_WEIGHTS["news_article"],
+        })
+
+    return signals
+
+
 @mcp.tool()
 async def full_multi_source_scan(
     company: str,
     include_web: bool = True,
     include_linkedin: bool = True,
+    exhaustive: bool = False,
 ) -> dict:
     """
     Run a comprehensive multi-source scan for Claude/Anthropic usage.
@@ -1879,6 +2509,7 @@ async def full_multi_source_scan(
         company: Company name to scan
         include_web: Include Brave Search (requires API key)
         include_linkedin: Include direct LinkedIn search (requires cookie)
+        exhaustive: Wait for every source even after the score reaches very_high
 
     Returns:
         Aggregated signals with confidence score
@@ -1887,142 +2518,63 @@ async def full_multi_source_scan(
     evidence = {}
     score = 0
 
-    # 1. GitHub scan
-    if GITHUB_TOKEN:
-        github_result = await _does_company_use_claude_impl(company)
-        evidence["github"] = github_result
-
-        if github_result.get("uses_claude") == "yes":
-            score += SIGNAL_WEIGHTS["github_mcp_config"]
-            signals.append({"source": "github", "signal": "MCP config found", "weight": 40})
-        elif github_result.get("uses_claude") == "likely":
-            score += SIGNAL_WEIGHTS["github_anthropic_sdk"]
-            signals.append({"source": "github", "signal": "Anthropic SDK usage", "weight": 30})
-
-    # 2. Hacker News scan
-    hn_result = await _search_hackernews_signals_impl(company)
-    evidence["hackernews"] = hn_result
-
-    if hn_result.get("total_mentions", 0) > 0:
-        weight = SIGNAL_WEIGHTS["hackernews_mention"]
-        score += weight
-        signals.append({
-            "source": "hackernews",
-            "signal": f"{hn_result['total_mentions']} HN mentions",
-            "weight": weight,
-        })
-
-    # 3. npm scan
-    npm_result = await _check_npm_anthropic_usage_impl(company)
-    evidence["npm"] = npm_result
-
-    if npm_result.get("packages_using_anthropic", 0) > 0:
-        weight = SIGNAL_WEIGHTS["npm_anthropic_dep"]
-        score += weight
-        signals.append({
-            "source": "npm",
-            "signal": f"{npm_result['packages_using_anthropic']} packages use Anthropic SDK",
-            "weight": weight,
-        })
-
-    # 4. PyPI scan
-    pypi_result = await _check_pypi_anthropic_usage_impl(company)
-    evidence["pypi"] = pypi_result
-
-    if pypi_result.get("packages_using_anthropic", 0) > 0:
-        weight = SIGNAL_WEIGHTS["pypi_anthropic_dep"]
-        score += weight
-        signals.append({
-            "source": "pypi",
-            "signal": f"{pypi_result['packages_using_anthropic']} packages use anthropic",
-            "weight": weight,
-        })
-
-    # 5. LinkedIn direct search (posts and jobs)
-    if include_linkedin and LINKEDIN_COOKIE:
-        # LinkedIn posts
-        linkedin_posts_result = await _search_linkedin_posts_impl(company)
-        evidence["linkedin_posts"] = linkedin_posts_result
-
-        if linkedin_posts_result.get("total_posts", 0) > 0:
-            weight = SIGNAL_WEIGHTS["linkedin_post"]
-            score += weight
-            signals.append({
-                "source": "linkedin_posts",
-                "signal": f"{linkedin_posts_result['total_posts']} LinkedIn posts about Claude",
-                "weight": weight,
-            })
-
-        # LinkedIn jobs
-        linkedin_jobs_result = await _search_linkedin_jobs_impl(company=company)
-        evidence["linkedin_jobs"] = linkedin_jobs_result
-
-        if linkedin_jobs_result.get("claude_related_jobs", 0) > 0:
-            weight = SIGNAL_WEIGHTS["linkedin_job"]
-            score += weight
-            signals.append({
-                "source": "linkedin_jobs",
-                "signal": f"{linkedin_jobs_result['claude_related_jobs']} LinkedIn job postings mention Claude/AI",
-                "weight": weight,
-            })
-
-    # 6. Web search (additional LinkedIn via Brave, News, Blogs)
-    if include_web and BRAVE_API_KEY:
-        web_result = await _search_web_signals_impl(company)
-        evidence["web"] = web_result
+    use_linkedin = bool(include_linkedin and LINKEDIN_COOKIE)
+    use_web = bool(include_web and BRAVE_API_KEY)
+
+    sources = [
+        ("github", _does_company_use_claude_impl, bool(GITHUB_TOKEN)),
+        ("hackernews", _search_hackernews_signals_impl, True),
+        ("npm", _check_npm_anthropic_usage_impl, True),
+        ("pypi", _check_pypi_anthropic_usage_impl, True),
+        ("linkedin_posts", _search_linkedin_posts_impl, use_linkedin),
+        ("linkedin_jobs", _search_linkedin_jobs_impl, use_linkedin),
+        ("web", _search_web_signals_impl, use_web),
+    ]
 
-        # Only add Brave LinkedIn if we didn't already get direct LinkedIn results
-        if not (include_linkedin and LINKEDIN_COOKIE):
-            if web_result.get("counts", {}).get("linkedin_posts", 0) > 0:
-                weight = SIGNAL_WEIGHTS["linkedin_post"]
-                score += weight
-                signals.append({
-                    "source": "linkedin_web",
-                    "signal": f"{web_result['counts']['linkedin_posts']} LinkedIn posts (via web search)",
-                    "weight": weight,
-                })
+    # Every source is independent, so query them all at once and score each
+    # as it lands. Once the score is very_high the rest can't change the
+    # verdict, so stop waiting for them (their fetches are shielded and still
+    # finish into the scan cache).
+    tasks = {
+        asyncio.ensure_future(_cached_scan(source, company, impl)): source
+        for source, impl, enabled in sources
+        if enabled
+    }
+    pending = set(tasks)
 
-        if web_result.get("counts", {}).get("blog_posts", 0) > 0:
-            weight = SIGNAL_WEIGHTS["engineering_blog"]
-            score += weight
-            signals.append({
-                "source": "engineering_blog",
-                "signal": f"{web_result['counts']['blog_posts']} blog posts",
-                "weight": weight,
-            })
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            source = tasks[task]
+            # A failing source is recorded but doesn't sink the rest of the scan
+            try:
+                result = task.result()
+            except Exception as e:
+                result = {"error": str(e)}
+            evidence[source] = result
+            for signal in _multi_source_signals(source, result, use_linkedin):
+                score += signal["weight"]
+                signals.append(signal)
 
-        if web_result.get("counts", {}).get("news_articles", 0) > 0:
-            weight = SIGNAL_WEIGHTS["news_article"]
-            score += weight
-            signals.append({
-                "source": "news",
-                "signal": f"{web_result['counts']['news_articles']} news articles",
-                "weight": weight,
-            })
+        if not exhaustive and score >= SCORE_THRESHOLDS[-1]:
+            for task in pending:
+                task.cancel()
+            break
 
     # Determine confidence level
-    if score >= 60:
-        confidence = "very_high"
-        verdict = "yes"
-    elif score >= 40:
-        confidence = "high"
-        verdict = "likely"
-    elif score >= 20:
-        confidence = "medium"
-        verdict = "possibly"
-    else:
-        confidence = "low"
-        verdict = "no strong evidence"
+    confidence = _score_confidence(score)
+    verdict = CONFIDENCE_VERDICTS.get(confidence, "no strong evidence")
 
     return {
         "company": company,
         "verdict": verdict,
         "confidence": confidence,
         "score": score,
-        "max_possible_score": sum(SIGNAL_WEIGHTS.values()),
+        "max_possible_score": MAX_POSSIBLE_SCORE,
         "signals_found": len(signals),
         "signals": sorted(signals, key=lambda x: x["weight"], reverse=True),
-        "sources_checked": list(evidence.keys()),
+        "sources_checked": [source for source, _, _ in sources if source in evidence],
+        "sources_skipped": [tasks[task] for task in pending],
         "evidence": evidence,
     }
 
@@ -2044,51 +2596,62 @@ async def check_api_status() -> dict:
         "pypi": {"configured": True, "status": "working (no key needed)", "required": False},
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        # Check TheirStack
-        if THEIRSTACK_API_KEY:
-            try:
-                resp = await client.get(
-                    f"{THEIRSTACK_BASE_URL}/technologies",
-                    headers={"Authorization": f"Bearer {THEIRSTACK_API_KEY}"},
-                    params={"limit": 1},
-                )
-                status["theirstack"]["status"] = "working" if resp.status_code == 200 else f"error: {resp.status_code}"
-            except Exception as e:
-                status["theirstack"]["status"] = f"error: {str(e)}"
+    client = get_http_client()
 
-        # Check GitHub
-        if GITHUB_TOKEN:
-            try:
-                resp = await client.get(
-                    f"{GITHUB_API}/rate_limit",
-                    headers={"Authorization": f"token {GITHUB_TOKEN}"},
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    remaining = data.get("resources", {}).get("search", {}).get("remaining", 0)
-                    status["github"]["status"] = f"working ({remaining} searches remaining)"
-                else:
-                    status["github"]["status"] = f"error: {resp.status_code}"
-            except Exception as e:
-                status["github"]["status"] = f"error: {str(e)}"
+    # The probes are independent, so they run concurrently and each fills in
+    # its own status entry
+    async def check_theirstack() -> None:
+        try:
+            resp = await client.get(
+                f"{THEIRSTACK_BASE_URL}/technologies",
+                headers=THEIRSTACK_HEADERS,
+                params={"limit": 1},
+                timeout=10.0,
+            )
+            status["theirstack"]["status"] = "working" if resp.status_code == 200 else f"error: {resp.status_code}"
+        except Exception as e:
+            status["theirstack"]["status"] = f"error: {str(e)}"
 
-        # Check LinkedIn
-        if LINKEDIN_COOKIE:
-            try:
-                headers = get_linkedin_headers()
-                resp = await client.get(
-                    f"{LINKEDIN_API}/me",
-                    headers=headers,
-                )
-                if resp.status_code == 200:
-                    status["linkedin"]["status"] = "working"
-                elif resp.status_code == 401:
-                    status["linkedin"]["status"] = "error: cookie expired - refresh from Chrome DevTools"
-                else:
-                    status["linkedin"]["status"] = f"error: {resp.status_code}"
-            except Exception as e:
-                status["linkedin"]["status"] = f"error: {str(e)}"
+    async def check_github() -> None:
+        try:
+            resp = await client.get(
+                f"{GITHUB_API}/rate_limit",
+                headers=GITHUB_HEADERS,
+                timeout=10.0,
+            )
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
+                remaining = data.get("resources", {}).get("search", {}).get("remaining", 0)
+                status["github"]["status"] = f"working ({remaining} searches remaining)"
+            else:
+                status["github"]["status"] = f"error: {resp.status_code}"
+        except Exception as e:
+            status["github"]["status"] = f"error: {str(e)}"
+
+    async def check_linkedin() -> None:
+        try:
+            resp = await client.get(
+                f"{LINKEDIN_API}/me",
+                headers=get_linkedin_headers(),
+                timeout=10.0,
+            )
+            if resp.status_code == 200:
+                status["linkedin"]["status"] = "working"
+            elif resp.status_code == 401:
+                status["linkedin"]["status"] = "error: cookie expired - refresh from Chrome DevTools"
+            else:
+                status["linkedin"]["status"] = f"error: {resp.status_code}"
+        except Exception as e:
+            status["linkedin"]["status"] = f"error: {str(e)}"
+
+    probes = []
+    if THEIRSTACK_API_KEY:
+        probes.append(check_theirstack())
+    if GITHUB_TOKEN:
+        probes.append(check_github())
+    if LINKEDIN_COOKIE:
+        probes.append(check_linkedin())
+    await asyncio.gather(*probes)
 
     # Ready if GitHub works (others are optional)
     github_ok = status["github"]["configured"] and "working" in status["github"]["status"]
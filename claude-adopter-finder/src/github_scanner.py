@@ -3,18 +3,56 @@ GitHub Signal Scanner MCP
 Finds companies/orgs using Claude by scanning GitHub for code signals.
 """
 
+import asyncio
 import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from typing import NamedTuple
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
 load_dotenv()
 
+
+# Shared HTTP client, reused by every tool so connections to the GitHub API
+# stay alive across calls instead of re-handshaking per invocation.
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Close the shared HTTP client when the server shuts down."""
+    global _http_client
+
+    try:
+        yield
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+
+
 mcp = FastMCP(
     "Claude Adopter Scanner - GitHub",
     instructions="Scan GitHub for companies using Claude/Anthropic",
+    lifespan=_lifespan,
 )
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
@@ -28,6 +66,157 @@ def get_headers():
     return headers
 
 
+# GitHub's secondary rate limits punish bursts, so cap concurrent code searches
+_search_semaphore = asyncio.Semaphore(3)
+
+# A search costs one quota unit whatever its page size, so always fetch a full
+# page and let callers truncate to their limit
+GITHUB_MAX_PER_PAGE = 100
+
+# Rate-limited searches are retried up to SEARCH_MAX_RETRIES times, waiting as
+# long as GitHub asks (Retry-After / X-RateLimit-Reset) or backing off from 1s,
+# but never more than SEARCH_MAX_RETRY_WAIT per attempt
+SEARCH_MAX_RETRIES = 3
+SEARCH_MAX_RETRY_WAIT = 30.0
+
+
+# Code searches: query -> (expires_at, in-flight or finished (status_code, hits)).
+# Results for queries like filename:.mcp.json change slowly, and each hit saves
+# search quota.
+# Tools running the same query at the same time (search_claude_code and
+# search_mcp_repos both look for .mcp.json files) share one request.
+SEARCH_CACHE_TTL = 3600.0
+_SEARCH_CACHE_MAX_ENTRIES = 1024
+_search_cache: dict[str, tuple[float, asyncio.Future]] = {}
+
+
+class _CodeHit(NamedTuple):
+    """One code search item, flattened to the fields the tools report."""
+
+    repo_name: str | None
+    repo_url: str | None
+    description: str | None
+    owner_login: str | None
+    owner_type: str | None  # User or Organization
+    path: str | None
+    file_url: str | None
+
+
+def _project_hit(item: dict) -> _CodeHit:
+    """Flatten a code search item into a _CodeHit."""
+    repo = item.get("repository", {})
+    owner = repo.get("owner", {})
+    return _CodeHit(
+        repo_name=repo.get("full_name"),
+        repo_url=repo.get("html_url"),
+        description=repo.get("description"),
+        owner_login=owner.get("login"),
+        owner_type=owner.get("type"),
+        path=item.get("path"),
+        file_url=item.get("html_url"),
+    )
+
+
+def _rate_limit_wait(response: httpx.Response, backoff: float) -> float | None:
+    """
+    Seconds to wait before retrying a rate-limited response, or None if the
+    response isn't a rate limit (e.g. a plain 403 Forbidden).
+    """
+    if response.status_code not in (403, 429):
+        return None
+
+    retry_after = response.headers.get("retry-after", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+
+    reset = response.headers.get("x-ratelimit-reset", "")
+    if response.headers.get("x-ratelimit-remaining") == "0" and reset.isdigit():
+        return max(0.0, int(reset) - time.time())
+
+    return backoff if response.status_code == 429 else None
+
+
+async def _fetch_search_page(query: str) -> tuple[int, list[_CodeHit]]:
+    """Fetch one full page of GitHub code search results as (status_code, hits)."""
+    backoff = 1.0
+    for attempt in range(SEARCH_MAX_RETRIES + 1):
+        async with _search_semaphore:
+            response = await get_http_client().get(
+                f"{GITHUB_API}/search/code",
+                params={"q": query, "per_page": GITHUB_MAX_PER_PAGE},
+                headers=get_headers(),
+            )
+
+        wait = _rate_limit_wait(response, backoff)
+        if wait is None or attempt == SEARCH_MAX_RETRIES:
+            break
+        # Sleep outside the semaphore so other searches can use the slot
+        await asyncio.sleep(min(wait, SEARCH_MAX_RETRY_WAIT))
+        backoff *= 2
+
+    if response.status_code != 200:
+        return response.status_code, []
+
+    # Keep only the projected hits; the full items (with their nested repository
+    # and owner objects) are dropped here rather than held in the cache
+    items = orjson.loads(response.content).get("items", [])
+    return 200, [_project_hit(item) for item in items]
+
+
+async def _search_code(query: str) -> tuple[int, list[_CodeHit]]:
+    """
+    Run one GitHub code search (a full page) and return (status_code, hits),
+    each hit flattened into a _CodeHit. 200 results are cached for
+    SEARCH_CACHE_TTL; other statuses return no hits.
+    """
+    now = time.monotonic()
+    entry = _search_cache.get(query)
+
+    if entry is None or entry[0] <= now:
+        if len(_search_cache) >= _SEARCH_CACHE_MAX_ENTRIES:
+            del _search_cache[next(iter(_search_cache))]
+        entry = (now + SEARCH_CACHE_TTL, asyncio.ensure_future(_fetch_search_page(query)))
+        _search_cache[query] = entry
+
+    try:
+        result = await asyncio.shield(entry[1])
+    except Exception:
+        if _search_cache.get(query) is entry:
+            del _search_cache[query]
+        raise
+
+    # Only successful searches stay cached
+    if result[0] != 200 and _search_cache.get(query) is entry:
+        del _search_cache[query]
+    return result
+
+
+# search_claude_code queries per signal type. Terms sharing the same qualifiers
+# are OR-ed into one search (each costs a unit of the 30/min search quota); the
+# SDK and MCP variants differ in extension/filename, so they stay separate.
+CODE_SEARCH_QUERIES = {
+    "api_keys": [
+        "ANTHROPIC_API_KEY OR ANTHROPIC_BASE_URL in:file",
+    ],
+    "mcp_configs": [
+        "filename:.mcp.json",
+        "filename:mcp.json mcpServers",
+    ],
+    "sdk_usage": [
+        '"@anthropic-ai/sdk" in:file extension:json',
+        '"from anthropic import" in:file extension:py',
+        '"import Anthropic" in:file extension:ts',
+    ],
+    "github_actions": [
+        "anthropics/claude-code-action OR claude-code-base-action in:file",
+    ],
+}
+# search_type="all": every (query, signal_type) pair, in table order
+_ALL_CODE_SEARCHES = [
+    (q, signal_type) for signal_type, q_list in CODE_SEARCH_QUERIES.items() for q in q_list
+]
+
+
 @mcp.tool()
 async def search_claude_code(
     search_type: str = "all",
@@ -50,115 +239,78 @@ async def search_claude_code(
             "repos": [],
         }
 
-    # Define search queries based on type
-    queries = {
-        "api_keys": [
-            "ANTHROPIC_API_KEY in:file",
-            "ANTHROPIC_BASE_URL in:file",
-        ],
-        "mcp_configs": [
-            "filename:.mcp.json",
-            "filename:mcp.json mcpServers",
-        ],
-        "sdk_usage": [
-            '"@anthropic-ai/sdk" in:file extension:json',
-            '"from anthropic import" in:file extension:py',
-            '"import Anthropic" in:file extension:ts',
-        ],
-        "github_actions": [
-            "anthropics/claude-code-action in:file",
-            "claude-code-base-action in:file",
-        ],
-    }
-
+    # (query, signal_type) pairs
     if search_type == "all":
-        search_queries = []
-        for q_list in queries.values():
-            search_queries.extend(q_list)
-    elif search_type in queries:
-        search_queries = queries[search_type]
+        search_queries = _ALL_CODE_SEARCHES
+    elif search_type in CODE_SEARCH_QUERIES:
+        search_queries = [(q, search_type) for q in CODE_SEARCH_QUERIES[search_type]]
     else:
-        return {"error": f"Invalid search_type. Use one of: all, {', '.join(queries.keys())}"}
+        return {
+            "error": f"Invalid search_type. Use one of: all, {', '.join(CODE_SEARCH_QUERIES)}"
+        }
 
-    all_repos = []
+    # First hit per repo wins; dict order keeps the query order
+    unique_repos: dict[str, dict] = {}
     orgs_seen = {}
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for query in search_queries:
-            try:
-                response = await client.get(
-                    f"{GITHUB_API}/search/code",
-                    params={"q": query, "per_page": min(limit, 100)},
-                    headers=get_headers(),
-                )
-
-                if response.status_code == 403:
-                    return {
-                        "error": "GitHub API rate limit exceeded. Try again later or use a token.",
-                        "repos": all_repos,
+    rate_limited = []
+
+    # Run every query at once, then fold the results in query order
+    responses = await asyncio.gather(
+        *(_search_code(query) for query, _ in search_queries),
+        return_exceptions=True,
+    )
+
+    for (query, signal_type), response in zip(search_queries, responses):
+        if isinstance(response, httpx.TimeoutException):
+            continue
+        if isinstance(response, BaseException):
+            raise response
+
+        status_code, hits = response
+
+        # Still limited after retries: report it, but keep the other queries' results
+        if status_code in (403, 429):
+            rate_limited.append(query)
+            continue
+
+        if status_code != 200:
+            continue
+
+        for hit in hits[:limit]:
+            repo_name = hit.repo_name
+
+            if repo_name not in unique_repos:
+                unique_repos[repo_name] = {
+                    "repo_name": repo_name,
+                    "repo_url": hit.repo_url,
+                    "owner_name": hit.owner_login,
+                    "owner_type": hit.owner_type,
+                    "file_matched": hit.path,
+                    "query_matched": query,
+                    "signal_type": signal_type,
+                }
+
+            # Track organizations
+            if hit.owner_type == "Organization":
+                org_login = hit.owner_login
+                if org_login not in orgs_seen:
+                    orgs_seen[org_login] = {
+                        "name": org_login,
+                        "url": f"https://github.com/{org_login}",
+                        "repos_with_signals": [],
                     }
+                orgs_seen[org_login]["repos_with_signals"].append(repo_name)
 
-                if response.status_code != 200:
-                    continue
-
-                data = response.json()
-
-                for item in data.get("items", []):
-                    repo = item.get("repository", {})
-                    owner = repo.get("owner", {})
-
-                    repo_info = {
-                        "repo_name": repo.get("full_name"),
-                        "repo_url": repo.get("html_url"),
-                        "owner_name": owner.get("login"),
-                        "owner_type": owner.get("type"),  # User or Organization
-                        "file_matched": item.get("path"),
-                        "query_matched": query,
-                        "signal_type": search_type if search_type != "all" else categorize_query(query),
-                    }
-
-                    # Track organizations
-                    if owner.get("type") == "Organization":
-                        org_login = owner.get("login")
-                        if org_login not in orgs_seen:
-                            orgs_seen[org_login] = {
-                                "name": org_login,
-                                "url": f"https://github.com/{org_login}",
-                                "repos_with_signals": [],
-                            }
-                        orgs_seen[org_login]["repos_with_signals"].append(repo.get("full_name"))
-
-                    all_repos.append(repo_info)
-
-            except httpx.TimeoutException:
-                continue
-
-    # Dedupe repos
-    seen_repos = set()
-    unique_repos = []
-    for repo in all_repos:
-        if repo["repo_name"] not in seen_repos:
-            seen_repos.add(repo["repo_name"])
-            unique_repos.append(repo)
-
-    return {
+    result = {
         "total_repos": len(unique_repos),
         "total_organizations": len(orgs_seen),
         "organizations": list(orgs_seen.values()),
-        "repos": unique_repos[:limit],
+        "repos": list(unique_repos.values())[:limit],
     }
-
-
-def categorize_query(query: str) -> str:
-    if "ANTHROPIC_API_KEY" in query or "ANTHROPIC_BASE_URL" in query:
-        return "api_keys"
-    if ".mcp.json" in query or "mcpServers" in query:
-        return "mcp_configs"
-    if "anthropic-ai/sdk" in query or "from anthropic" in query or "import Anthropic" in query:
-        return "sdk_usage"
-    if "claude-code-action" in query:
-        return "github_actions"
-    return "other"
+    if rate_limited:
+        result["error"] = "GitHub API rate limit exceeded. Try again later or use a token."
+        result["rate_limited_queries"] = rate_limited
+    return result
 
 
 @mcp.tool()
@@ -186,51 +338,75 @@ async def search_mcp_repos(
         '"mcpServers" in:file extension:json',
     ]
 
-    repos = []
-    seen = set()
+    if min_stars > 0:
+        queries = [f"{query} stars:>={min_stars}" for query in queries]
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for query in queries:
-            if min_stars > 0:
-                query += f" stars:>={min_stars}"
+    repos: dict[str, dict] = {}
 
-            response = await client.get(
-                f"{GITHUB_API}/search/code",
-                params={"q": query, "per_page": limit},
-                headers=get_headers(),
-            )
-
-            if response.status_code != 200:
-                continue
-
-            data = response.json()
+    responses = await asyncio.gather(
+        *(_search_code(query) for query in queries)
+    )
 
-            for item in data.get("items", []):
-                repo = item.get("repository", {})
-                repo_name = repo.get("full_name")
+    for status_code, hits in responses:
+        if status_code != 200:
+            continue
 
-                if repo_name and repo_name not in seen:
-                    seen.add(repo_name)
-                    owner = repo.get("owner", {})
+        for hit in hits[:limit]:
+            repo_name = hit.repo_name
 
-                    repos.append({
-                        "repo": repo_name,
-                        "url": repo.get("html_url"),
-                        "owner": owner.get("login"),
-                        "owner_type": owner.get("type"),
-                        "config_file": item.get("path"),
-                        "description": repo.get("description"),
-                        "confidence": "very_high",
-                        "signal": "MCP configuration file found",
-                    })
+            if repo_name and repo_name not in repos:
+                repos[repo_name] = {
+                    "repo": repo_name,
+                    "url": hit.repo_url,
+                    "owner": hit.owner_login,
+                    "owner_type": hit.owner_type,
+                    "config_file": hit.path,
+                    "description": hit.description,
+                    "confidence": "very_high",
+                    "signal": "MCP configuration file found",
+                }
 
     return {
         "total_repos": len(repos),
         "note": ".mcp.json files indicate active Claude Code/Desktop usage",
-        "repos": repos,
+        "repos": list(repos.values()),
     }
 
 
+# Org profiles: lowercased login -> (expires_at, org_info). With the search cache
+# this makes a repeat get_org_claude_usage call within the TTL network-free.
+_org_info_cache: dict[str, tuple[float, dict]] = {}
+
+
+async def _get_org_info(org_name: str) -> dict:
+    """Fetch the profile fields reported for an org ({} if it can't be fetched)."""
+    key = org_name.lower()
+    cached = _org_info_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    org_response = await get_http_client().get(
+        f"{GITHUB_API}/orgs/{org_name}",
+        headers=get_headers(),
+    )
+    if org_response.status_code != 200:
+        return {}
+
+    org_data = orjson.loads(org_response.content)
+    org_info = {
+        "name": org_data.get("name"),
+        "company": org_data.get("company"),
+        "blog": org_data.get("blog"),
+        "location": org_data.get("location"),
+        "public_repos": org_data.get("public_repos"),
+        "followers": org_data.get("followers"),
+    }
+    if len(_org_info_cache) >= _SEARCH_CACHE_MAX_ENTRIES:
+        del _org_info_cache[next(iter(_org_info_cache))]
+    _org_info_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL, org_info)
+    return org_info
+
+
 @mcp.tool()
 async def get_org_claude_usage(
     org_name: str,
@@ -254,48 +430,27 @@ async def get_org_claude_usage(
         "github_actions": [],
     }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Search within the org
-        search_queries = [
-            (f"org:{org_name} filename:.mcp.json", "mcp_configs"),
-            (f"org:{org_name} ANTHROPIC_API_KEY in:file", "api_keys"),
-            (f'org:{org_name} "@anthropic-ai/sdk" in:file', "anthropic_sdk"),
-            (f"org:{org_name} claude-code-action in:file", "github_actions"),
-        ]
-
-        for query, signal_type in search_queries:
-            response = await client.get(
-                f"{GITHUB_API}/search/code",
-                params={"q": query, "per_page": 30},
-                headers=get_headers(),
-            )
+    # Search within the org
+    search_queries = [
+        (f"org:{org_name} filename:.mcp.json", "mcp_configs"),
+        (f"org:{org_name} ANTHROPIC_API_KEY in:file", "api_keys"),
+        (f'org:{org_name} "@anthropic-ai/sdk" in:file', "anthropic_sdk"),
+        (f"org:{org_name} claude-code-action in:file", "github_actions"),
+    ]
 
-            if response.status_code == 200:
-                data = response.json()
-                for item in data.get("items", []):
-                    signals[signal_type].append({
-                        "repo": item.get("repository", {}).get("full_name"),
-                        "file": item.get("path"),
-                        "url": item.get("html_url"),
-                    })
-
-        # Get org info
-        org_response = await client.get(
-            f"{GITHUB_API}/orgs/{org_name}",
-            headers=get_headers(),
-        )
+    # Org info and every signal search go out together
+    org_info, *responses = await asyncio.gather(
+        _get_org_info(org_name),
+        *(_search_code(query) for query, _ in search_queries),
+    )
 
-        org_info = {}
-        if org_response.status_code == 200:
-            org_data = org_response.json()
-            org_info = {
-                "name": org_data.get("name"),
-                "company": org_data.get("company"),
-                "blog": org_data.get("blog"),
-                "location": org_data.get("location"),
-                "public_repos": org_data.get("public_repos"),
-                "followers": org_data.get("followers"),
-            }
+    for (_, signal_type), (_, hits) in zip(search_queries, responses):
+        for hit in hits[:30]:
+            signals[signal_type].append({
+                "repo": hit.repo_name,
+                "file": hit.path,
+                "url": hit.file_url,
+            })
 
     total_signals = sum(len(v) for v in signals.values())
 
@@ -328,43 +483,33 @@ async def find_claude_action_users(
         "anthropic_api_key in:file path:.github/workflows",
     ]
 
-    repos = []
-    seen = set()
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for query in queries:
-            response = await client.get(
-                f"{GITHUB_API}/search/code",
-                params={"q": query, "per_page": limit},
-                headers=get_headers(),
-            )
-
-            if response.status_code != 200:
-                continue
+    repos: dict[str, dict] = {}
 
-            data = response.json()
+    responses = await asyncio.gather(
+        *(_search_code(query) for query in queries)
+    )
 
-            for item in data.get("items", []):
-                repo = item.get("repository", {})
-                repo_name = repo.get("full_name")
+    for status_code, hits in responses:
+        if status_code != 200:
+            continue
 
-                if repo_name and repo_name not in seen:
-                    seen.add(repo_name)
-                    owner = repo.get("owner", {})
+        for hit in hits[:limit]:
+            repo_name = hit.repo_name
 
-                    repos.append({
-                        "repo": repo_name,
-                        "url": repo.get("html_url"),
-                        "owner": owner.get("login"),
-                        "owner_type": owner.get("type"),
-                        "workflow_file": item.get("path"),
-                        "confidence": "very_high",
-                        "signal": "Claude Code GitHub Action in CI/CD",
-                    })
+            if repo_name and repo_name not in repos:
+                repos[repo_name] = {
+                    "repo": repo_name,
+                    "url": hit.repo_url,
+                    "owner": hit.owner_login,
+                    "owner_type": hit.owner_type,
+                    "workflow_file": hit.path,
+                    "confidence": "very_high",
+                    "signal": "Claude Code GitHub Action in CI/CD",
+                }
 
     # Separate orgs from users
-    orgs = [r for r in repos if r["owner_type"] == "Organization"]
-    users = [r for r in repos if r["owner_type"] == "User"]
+    orgs = [r for r in repos.values() if r["owner_type"] == "Organization"]
+    users = [r for r in repos.values() if r["owner_type"] == "User"]
 
     return {
         "total_repos": len(repos),
@@ -3,23 +3,152 @@ Job Posting Scanner MCP
 Finds companies mentioning Claude/Anthropic in job postings via TheirStack API.
 """
 
+import asyncio
 import os
-from datetime import datetime, timedelta
+import random
+import re
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 
 import httpx
+import orjson
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
 load_dotenv()
 
+
+# Shared HTTP client, reused by every tool so connections to TheirStack stay
+# alive across calls instead of re-handshaking per invocation.
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Close the shared HTTP client when the server shuts down."""
+    global _http_client
+
+    try:
+        yield
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+
+
 mcp = FastMCP(
     "Claude Adopter Scanner - Jobs",
     instructions="Scan job postings for companies using Claude Desktop/Code",
+    lifespan=_lifespan,
 )
 
 THEIRSTACK_API_KEY = os.getenv("THEIRSTACK_API_KEY")
 THEIRSTACK_BASE_URL = "https://api.theirstack.com/v1"
 
+# Request headers, built once and shared read-only (tools only run with a key set)
+THEIRSTACK_HEADERS = MappingProxyType({
+    "Authorization": f"Bearer {THEIRSTACK_API_KEY}",
+    "Content-Type": "application/json",
+})
+
+# Concurrent tool calls share one budget: at most 4 searches in flight and
+# 4 started per second, so parallel agents don't burst into 429s
+_theirstack_semaphore = asyncio.Semaphore(4)
+_theirstack_limiter = AsyncLimiter(4, 1)
+
+# Transient failures (429, 5xx, dropped connections) are retried with jittered
+# exponential backoff, or after Retry-After when the API sends one
+SEARCH_MAX_TRIES = 5
+SEARCH_MAX_BACKOFF = 30.0
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+# Identical searches within SEARCH_CACHE_TTL seconds (agents often re-run a
+# tool with the same arguments) share one request; cached by payload
+SEARCH_CACHE_TTL = 300.0
+_SEARCH_CACHE_MAX_ENTRIES = 256
+_search_cache: dict[bytes, tuple[float, asyncio.Future]] = {}
+
+
+async def _fetch_jobs(payload: dict) -> httpx.Response:
+    """
+    POST one TheirStack job search within the shared concurrency and rate limits.
+    Returns the last response once retries run out; re-raises a transport error
+    from the final try.
+    """
+    for attempt in range(SEARCH_MAX_TRIES):
+        delay = min(SEARCH_MAX_BACKOFF, 2**attempt) + random.uniform(0, 0.5)
+        try:
+            async with _theirstack_semaphore, _theirstack_limiter:
+                response = await get_http_client().post(
+                    f"{THEIRSTACK_BASE_URL}/jobs/search",
+                    headers=THEIRSTACK_HEADERS,
+                    json=payload,
+                )
+        except httpx.TransportError:
+            if attempt == SEARCH_MAX_TRIES - 1:
+                raise
+        else:
+            if response.status_code not in _RETRY_STATUSES or attempt == SEARCH_MAX_TRIES - 1:
+                return response
+            retry_after = response.headers.get("retry-after", "")
+            if retry_after.isdigit():
+                delay = min(SEARCH_MAX_BACKOFF, float(retry_after))
+
+        # Back off outside the semaphore so other searches can proceed
+        await asyncio.sleep(delay)
+
+
+async def _search_jobs(payload: dict) -> httpx.Response:
+    """
+    Run a TheirStack job search, sharing an in-flight or recent identical one.
+    Only 200 responses stay cached, for SEARCH_CACHE_TTL seconds.
+    """
+    key = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    now = time.monotonic()
+    entry = _search_cache.get(key)
+
+    if entry is None or entry[0] <= now:
+        if len(_search_cache) >= _SEARCH_CACHE_MAX_ENTRIES:
+            del _search_cache[next(iter(_search_cache))]
+        entry = (now + SEARCH_CACHE_TTL, asyncio.ensure_future(_fetch_jobs(payload)))
+        _search_cache[key] = entry
+
+    try:
+        response = await asyncio.shield(entry[1])
+    except Exception:
+        if _search_cache.get(key) is entry:
+            del _search_cache[key]
+        raise
+
+    if response.status_code != 200 and _search_cache.get(key) is entry:
+        del _search_cache[key]
+    return response
+
+
+def _date_n_days_ago(days: int) -> str:
+    """Return the UTC date `days` ago as YYYY-MM-DD, for posted_at_gte filters."""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat()
+
+
 # Keywords that signal Claude/Anthropic usage
 CLAUDE_KEYWORDS = [
     "Claude",
@@ -39,27 +168,75 @@ HIGH_CONFIDENCE_KEYWORDS = [
     "Model Context Protocol",
 ]
 
+# (keyword, lowercased keyword) pairs, lowered once at import for matching
+_HIGH_CONFIDENCE_LC = tuple((kw, kw.lower()) for kw in HIGH_CONFIDENCE_KEYWORDS)
+_CLAUDE_KEYWORDS_LC = tuple((kw, kw.lower()) for kw in CLAUDE_KEYWORDS)
+
+# Single-pass matcher: one alternation over every lowercased keyword, run
+# against lowercased text, longest first so "Claude Code" wins over "Claude".
+# Keywords only match as whole words, so "MCP" doesn't fire inside "McPherson".
+_KEYWORD_ALTERNATION = "|".join(
+    re.escape(kw_lc)
+    for kw_lc in sorted(
+        {kw_lc for _, kw_lc in _HIGH_CONFIDENCE_LC + _CLAUDE_KEYWORDS_LC},
+        key=len,
+        reverse=True,
+    )
+)
+_KEYWORD_RE = re.compile(rf"\b(?:{_KEYWORD_ALTERNATION})\b")
+
+# Confidence levels as integer ranks, so companies compare and sort on ints
+CONFIDENCE_RANKS = MappingProxyType({"low": 1, "medium": 2, "high": 3})
+_RANK_CONFIDENCE = MappingProxyType({rank: conf for conf, rank in CONFIDENCE_RANKS.items()})
+
+# Only the first 8 KB of a description is scanned: Claude mentions sit in the
+# stack/requirements sections near the top, while full TheirStack descriptions
+# can run to tens of KB. Raise this if late-in-body mentions start being missed.
+DESCRIPTION_SCAN_LIMIT = 8192
+
 
 def calculate_confidence(job_description: str, job_title: str) -> tuple[str, list[str]]:
     """Calculate confidence level based on keyword matches."""
-    text = f"{job_title} {job_description}".lower()
-    matched_keywords = []
-
-    for kw in HIGH_CONFIDENCE_KEYWORDS:
-        if kw.lower() in text:
-            matched_keywords.append(kw)
+    text = f"{job_title} {job_description[:DESCRIPTION_SCAN_LIMIT]}".lower()
+    hits = set(_KEYWORD_RE.findall(text))
+    if not hits:
+        return "low", []
 
+    matched_keywords = [kw for kw, kw_lc in _HIGH_CONFIDENCE_LC if kw_lc in hits]
     if matched_keywords:
         return "high", matched_keywords
 
-    for kw in CLAUDE_KEYWORDS:
-        if kw.lower() in text:
-            matched_keywords.append(kw)
+    return "medium", [kw for kw, kw_lc in _CLAUDE_KEYWORDS_LC if kw_lc in hits]
 
-    if matched_keywords:
-        return "medium", matched_keywords
 
-    return "low", []
+# TheirStack re-returns reposted listings and the same postings show up across
+# tools, so classifications are memoized on (scanned description prefix, title);
+# keying on the DESCRIPTION_SCAN_LIMIT prefix bounds both memory and hashing
+@lru_cache(maxsize=2048)
+def _cached_confidence(job_description: str, job_title: str) -> tuple[str, tuple[str, ...]]:
+    """calculate_confidence with an immutable result, safe to share from the cache."""
+    confidence, keywords = calculate_confidence(job_description, job_title)
+    return confidence, tuple(keywords)
+
+
+def _classify_jobs(jobs: list[dict]) -> list[tuple[str, list[str]]]:
+    """Run calculate_confidence over a batch of raw job postings."""
+    classifications = []
+    for job in jobs:
+        description = (job.get("job_description") or "")[:DESCRIPTION_SCAN_LIMIT]
+        confidence, keywords = _cached_confidence(description, job.get("job_title") or "")
+        classifications.append((confidence, list(keywords)))
+    return classifications
+
+
+def _normalize_domain(domain: str) -> str:
+    """Lowercase a company domain and drop a leading "www.", for matching."""
+    return domain.lower().removeprefix("www.")
+
+
+def _company_key(job: dict) -> str:
+    """Dedupe key for a job's company: its domain (or name), lowercased, minus www."""
+    return _normalize_domain(job.get("company_domain") or job.get("company_name") or "unknown")
 
 
 @mcp.tool()
@@ -81,7 +258,9 @@ async def search_claude_jobs(
         limit: Maximum results to return (default 100)
 
     Returns:
-        Dictionary with companies found and their Claude signals
+        Dictionary with companies found and their Claude signals. Each company
+        lists only its medium/high-confidence jobs; low-confidence ones are
+        tallied in low_confidence_job_count (and included in job_count).
     """
     if not THEIRSTACK_API_KEY:
         return {
@@ -90,7 +269,7 @@ async def search_claude_jobs(
         }
 
     # Build the search query
-    posted_after = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    posted_after = _date_n_days_ago(days_back)
 
     payload = {
         "job_description_pattern_or": CLAUDE_KEYWORDS,
@@ -104,36 +283,30 @@ async def search_claude_jobs(
     if countries:
         payload["job_country_code_or"] = countries
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            f"{THEIRSTACK_BASE_URL}/jobs/search",
-            headers={
-                "Authorization": f"Bearer {THEIRSTACK_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
+    response = await _search_jobs(payload)
 
-        if response.status_code != 200:
-            return {
-                "error": f"TheirStack API error: {response.status_code} - {response.text}",
-                "companies": [],
-            }
+    if response.status_code != 200:
+        return {
+            "error": f"TheirStack API error: {response.status_code} - {response.text}",
+            "companies": [],
+        }
 
-        data = response.json()
+    data = orjson.loads(response.content)
+    jobs = data.get("data", [])
+
+    # Keyword scanning over 100+ long descriptions is CPU-bound; run it off the
+    # event loop so concurrent tool calls aren't stalled behind it
+    classifications = await asyncio.to_thread(_classify_jobs, jobs)
 
     # Process and dedupe by company
     companies_map = {}
 
-    for job in data.get("data", []):
-        company_domain = job.get("company_domain") or job.get("company_name", "unknown")
-        confidence, keywords = calculate_confidence(
-            job.get("job_description", ""),
-            job.get("job_title", ""),
-        )
+    for job, (confidence, keywords) in zip(jobs, classifications):
+        company_domain = _company_key(job)
 
-        if company_domain not in companies_map:
-            companies_map[company_domain] = {
+        company = companies_map.get(company_domain)
+        if company is None:
+            company = companies_map[company_domain] = {
                 "company_name": job.get("company_name"),
                 "domain": job.get("company_domain"),
                 "employee_count": job.get("company_num_employees"),
@@ -141,11 +314,17 @@ async def search_claude_jobs(
                 "country": job.get("company_country"),
                 "linkedin_url": job.get("company_linkedin_url"),
                 "jobs": [],
-                "all_keywords": set(),
-                "highest_confidence": "low",
+                "all_keywords": {},  # insertion-ordered set
+                "highest_confidence_rank": CONFIDENCE_RANKS["low"],
+                "low_confidence_job_count": 0,
             }
 
-        companies_map[company_domain]["jobs"].append({
+        # Low-confidence jobs (no keyword hit in the scanned text) are only counted
+        if confidence == "low":
+            company["low_confidence_job_count"] += 1
+            continue
+
+        company["jobs"].append({
             "title": job.get("job_title"),
             "url": job.get("job_url"),
             "posted_date": job.get("date_posted"),
@@ -154,27 +333,25 @@ async def search_claude_jobs(
             "matched_keywords": keywords,
         })
 
-        companies_map[company_domain]["all_keywords"].update(keywords)
+        company["all_keywords"].update(dict.fromkeys(keywords))
 
         # Update highest confidence
-        conf_order = {"high": 3, "medium": 2, "low": 1}
-        current = companies_map[company_domain]["highest_confidence"]
-        if conf_order[confidence] > conf_order[current]:
-            companies_map[company_domain]["highest_confidence"] = confidence
+        company["highest_confidence_rank"] = max(
+            company["highest_confidence_rank"], CONFIDENCE_RANKS[confidence]
+        )
 
     # Convert to list and sort by confidence + job count
     companies = []
     for domain, company in companies_map.items():
         company["all_keywords"] = list(company["all_keywords"])
-        company["job_count"] = len(company["jobs"])
+        company["job_count"] = len(company["jobs"]) + company["low_confidence_job_count"]
+        company["highest_confidence"] = _RANK_CONFIDENCE[company["highest_confidence_rank"]]
         companies.append(company)
 
     # Sort: high confidence first, then by job count
-    conf_order = {"high": 3, "medium": 2, "low": 1}
-    companies.sort(
-        key=lambda c: (conf_order[c["highest_confidence"]], c["job_count"]),
-        reverse=True,
-    )
+    companies.sort(key=itemgetter("highest_confidence_rank", "job_count"), reverse=True)
+    for company in companies:
+        del company["highest_confidence_rank"]
 
     return {
         "total_companies": len(companies),
@@ -210,7 +387,7 @@ async def search_mcp_jobs(
             "companies": [],
         }
 
-    posted_after = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    posted_after = _date_n_days_ago(days_back)
 
     payload = {
         "job_description_pattern_or": [
@@ -224,20 +401,12 @@ async def search_mcp_jobs(
         "order_by": [{"field": "date_posted", "desc": True}],
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            f"{THEIRSTACK_BASE_URL}/jobs/search",
-            headers={
-                "Authorization": f"Bearer {THEIRSTACK_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
+    response = await _search_jobs(payload)
 
-        if response.status_code != 200:
-            return {"error": f"API error: {response.text}", "companies": []}
+    if response.status_code != 200:
+        return {"error": f"API error: {response.text}", "companies": []}
 
-        data = response.json()
+    data = orjson.loads(response.content)
 
     # These are all high-confidence since MCP is Anthropic-specific
     companies = []
@@ -245,8 +414,9 @@ async def search_mcp_jobs(
 
     for job in data.get("data", []):
         domain = job.get("company_domain")
-        if domain and domain not in seen:
-            seen.add(domain)
+        key = domain and _company_key(job)
+        if key and key not in seen:
+            seen.add(key)
             companies.append({
                 "company_name": job.get("company_name"),
                 "domain": domain,
@@ -269,6 +439,103 @@ async def search_mcp_jobs(
     }
 
 
+# Jobs fetched per company, jobs one batched request may return (TheirStack
+# bills per returned job), and so companies per batched get_companies_jobs request
+COMPANY_JOBS_LIMIT = 100
+COMPANY_BATCH_JOBS_LIMIT = 1000
+COMPANY_BATCH_SIZE = COMPANY_BATCH_JOBS_LIMIT // COMPANY_JOBS_LIMIT
+
+
+def _summarize_company_jobs(domain: str, company_jobs: list[dict]) -> dict:
+    """Build the get_company_jobs result for one company's raw job postings."""
+    jobs = []
+    claude_signals = []
+
+    for job, (confidence, keywords) in zip(company_jobs, _classify_jobs(company_jobs)):
+        job_info = {
+            "title": job.get("job_title"),
+            "url": job.get("job_url"),
+            "posted": job.get("date_posted"),
+            "location": job.get("job_location"),
+        }
+
+        if keywords:
+            job_info["claude_signals"] = keywords
+            job_info["confidence"] = confidence
+            claude_signals.append(job_info)
+
+        jobs.append(job_info)
+
+    return {
+        "domain": domain,
+        "total_jobs": len(jobs),
+        "jobs_with_claude_signals": len(claude_signals),
+        "claude_signal_jobs": claude_signals,
+        "all_jobs": jobs[:20],  # Limit to 20 for readability
+    }
+
+
+async def _get_company_jobs_since(domain: str, posted_after: str) -> dict:
+    """Look up one company's newest jobs (up to COMPANY_JOBS_LIMIT) since a date."""
+    payload = {
+        "company_domain_or": [domain],
+        "posted_at_gte": posted_after,
+        "limit": COMPANY_JOBS_LIMIT,
+        "order_by": [{"field": "date_posted", "desc": True}],
+    }
+
+    response = await _search_jobs(payload)
+
+    if response.status_code != 200:
+        return {"domain": domain, "error": f"API error: {response.text}"}
+
+    data = orjson.loads(response.content)
+    return await asyncio.to_thread(_summarize_company_jobs, domain, data.get("data", []))
+
+
+async def _get_company_jobs_impl(domain: str, days_back: int = 90) -> dict:
+    """Internal implementation for company job lookup."""
+    return await _get_company_jobs_since(domain, _date_n_days_ago(days_back))
+
+
+async def _get_company_batch_jobs(domains: list[str], posted_after: str) -> list[dict]:
+    """
+    Look up several (normalized) companies with one search and split the jobs
+    back out by domain. Newest jobs come first, capped at COMPANY_JOBS_LIMIT per
+    company. If the search fills its limit, companies still under their cap may
+    have been crowded out by busier ones, so their results are marked truncated.
+    """
+    limit = COMPANY_JOBS_LIMIT * len(domains)
+    payload = {
+        "company_domain_or": domains,
+        "posted_at_gte": posted_after,
+        "limit": limit,
+        "order_by": [{"field": "date_posted", "desc": True}],
+    }
+
+    response = await _search_jobs(payload)
+
+    if response.status_code != 200:
+        error = f"API error: {response.text}"
+        return [{"domain": domain, "error": error} for domain in domains]
+
+    jobs = orjson.loads(response.content).get("data", [])
+    by_domain = {domain: [] for domain in domains}
+    for job in jobs:
+        company_jobs = by_domain.get(_normalize_domain(job.get("company_domain") or ""))
+        if company_jobs is not None and len(company_jobs) < COMPANY_JOBS_LIMIT:
+            company_jobs.append(job)
+
+    summaries = await asyncio.to_thread(
+        lambda: [_summarize_company_jobs(domain, by_domain[domain]) for domain in domains]
+    )
+    if len(jobs) >= limit:
+        for summary in summaries:
+            if summary["total_jobs"] < COMPANY_JOBS_LIMIT:
+                summary["truncated"] = True
+    return summaries
+
+
 @mcp.tool()
 async def get_company_jobs(
     domain: str,
@@ -287,58 +554,55 @@ async def get_company_jobs(
     if not THEIRSTACK_API_KEY:
         return {"error": "THEIRSTACK_API_KEY not set"}
 
-    posted_after = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    return await _get_company_jobs_impl(domain, days_back)
 
-    payload = {
-        "company_domain_or": [domain],
-        "posted_at_gte": posted_after,
-        "limit": 100,
-    }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            f"{THEIRSTACK_BASE_URL}/jobs/search",
-            headers={
-                "Authorization": f"Bearer {THEIRSTACK_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
-
-        if response.status_code != 200:
-            return {"error": f"API error: {response.text}"}
-
-        data = response.json()
-
-    jobs = []
-    claude_signals = []
+@mcp.tool()
+async def get_companies_jobs(
+    domains: list[str],
+    days_back: int = 90,
+) -> dict:
+    """
+    Get recent jobs for several companies at once, with Claude/AI signal analysis.
 
-    for job in data.get("data", []):
-        confidence, keywords = calculate_confidence(
-            job.get("job_description", ""),
-            job.get("job_title", ""),
-        )
+    Args:
+        domains: Company domains (e.g., ['stripe.com', 'vercel.com'])
+        days_back: How far back to search
 
-        job_info = {
-            "title": job.get("job_title"),
-            "url": job.get("job_url"),
-            "posted": job.get("date_posted"),
-            "location": job.get("job_location"),
-        }
+    Returns:
+        Per-domain results in the same shape as get_company_jobs; "truncated"
+        marks a company whose jobs may have been crowded out by a busier one
+        in its batch
+    """
+    if not THEIRSTACK_API_KEY:
+        return {"error": "THEIRSTACK_API_KEY not set"}
 
-        if keywords:
-            job_info["claude_signals"] = keywords
-            job_info["confidence"] = confidence
-            claude_signals.append(job_info)
+    posted_after = _date_n_days_ago(days_back)
+
+    # One search per COMPANY_BATCH_SIZE domains (company_domain_or takes a list),
+    # with the batches running concurrently within _search_jobs' API limits
+    domains = list(dict.fromkeys(_normalize_domain(domain) for domain in domains))
+    batches = [
+        domains[i:i + COMPANY_BATCH_SIZE] for i in range(0, len(domains), COMPANY_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(
+        *(_get_company_batch_jobs(batch, posted_after) for batch in batches),
+        return_exceptions=True,
+    )
 
-        jobs.append(job_info)
+    companies = []
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            companies.extend({"domain": domain, "error": str(result)} for domain in batch)
+        else:
+            companies.extend(result)
 
     return {
-        "domain": domain,
-        "total_jobs": len(jobs),
-        "jobs_with_claude_signals": len(claude_signals),
-        "claude_signal_jobs": claude_signals,
-        "all_jobs": jobs[:20],  # Limit to 20 for readability
+        "total_companies": len(companies),
+        "companies_with_claude_signals": sum(
+            1 for c in companies if c.get("jobs_with_claude_signals")
+        ),
+        "companies": companies,
     }
 
 